@@ -18,6 +18,7 @@ Last Grunted: 02/05/2026
 import asyncio
 import logging
 import os
+import re
 from pathlib import Path
 from typing import Any, Callable, Literal, Optional, Protocol, runtime_checkable
 
@@ -72,19 +73,19 @@ class AnalyzerProtocol(Protocol):
 # Constants
 # =============================================================================
 
-CHECKLIST_ITEMS = [
+CHECKLIST_ITEMS: tuple[str, ...] = (
     "Intro",
     "Role Overview",
     "Background",
     "Python Question",
     "Salary Expectations",
     "Next Steps",
-]
+)
 
-CHECKLIST_STATUSES = ["pending", "analyzing", "complete"]
+CHECKLIST_STATUSES: tuple[str, ...] = ("pending", "analyzing", "complete")
 
-TOPIC_KEYWORDS: dict[str, list[str]] = {
-    "Intro": [
+TOPIC_KEYWORDS: dict[str, tuple[str, ...]] = {
+    "Intro": (
         "good morning",
         "welcome",
         "thank you for joining",
@@ -92,8 +93,8 @@ TOPIC_KEYWORDS: dict[str, list[str]] = {
         "nice to meet",
         "glad you could",
         "thanks for coming",
-    ],
-    "Role Overview": [
+    ),
+    "Role Overview": (
         "role",
         "position",
         "responsibilities",
@@ -102,8 +103,8 @@ TOPIC_KEYWORDS: dict[str, list[str]] = {
         "day to day",
         "what you'll be doing",
         "scope",
-    ],
-    "Background": [
+    ),
+    "Background": (
         "experience",
         "background",
         "tell me about yourself",
@@ -113,8 +114,8 @@ TOPIC_KEYWORDS: dict[str, list[str]] = {
         "resume",
         "journey",
         "history",
-    ],
-    "Python Question": [
+    ),
+    "Python Question": (
         "python",
         "coding",
         "technical",
@@ -125,8 +126,8 @@ TOPIC_KEYWORDS: dict[str, list[str]] = {
         "data structures",
         "complexity",
         "function",
-    ],
-    "Salary Expectations": [
+    ),
+    "Salary Expectations": (
         "salary",
         "compensation",
         "expectations",
@@ -136,8 +137,8 @@ TOPIC_KEYWORDS: dict[str, list[str]] = {
         "package",
         "equity",
         "bonus",
-    ],
-    "Next Steps": [
+    ),
+    "Next Steps": (
         "questions for us",
         "next steps",
         "timeline",
@@ -147,10 +148,36 @@ TOPIC_KEYWORDS: dict[str, list[str]] = {
         "anything else",
         "final thoughts",
         "wrap up",
-    ],
+    ),
 }
 
 
+def _build_topic_matcher(
+    topic_keywords: dict[str, tuple[str, ...]],
+) -> tuple[Optional["re.Pattern[str]"], dict[str, tuple[str, ...]]]:
+    """
+    Compile every topic keyword into one overlapping, longest-first scan.
+
+    At each text position the lookahead reports the longest keyword that
+    starts there; any shorter keyword starting at the same position is a
+    prefix of it, so mapping each reported keyword to all keywords that are
+    its prefixes recovers exactly the set ``{kw for kw in ... if kw in text}``.
+    """
+    keywords = {kw for kws in topic_keywords.values() for kw in kws}
+    if not keywords:
+        return None, {}
+    ordered = sorted(keywords, key=len, reverse=True)
+    pattern = re.compile(f"(?=({'|'.join(map(re.escape, ordered))}))")
+    prefixes = {
+        kw: tuple(other for other in keywords if kw.startswith(other))
+        for kw in keywords
+    }
+    return pattern, prefixes
+
+
+_TOPIC_KEYWORD_PATTERN, _TOPIC_KEYWORD_PREFIXES = _build_topic_matcher(TOPIC_KEYWORDS)
+
+
 # =============================================================================
 # Pydantic Models
 # =============================================================================
@@ -427,15 +454,29 @@ class ChecklistAgent:
 
         return "\n".join(parts)
 
-    def _quick_topic_detection(self, text: str) -> Optional[str]:
+    def _quick_topic_detection(
+        self,
+        text: str,
+        text_lower: Optional[str] = None,
+    ) -> Optional[str]:
         """
         Quick keyword-based topic detection for efficiency.
         Returns detected topic or None if no strong match.
         """
-        text_lower = text.lower()
+        if _TOPIC_KEYWORD_PATTERN is None:
+            return None
+        if text_lower is None:
+            text_lower = text.lower()
+
+        # One pass over the text collects every keyword present.
+        found: set[str] = set()
+        for match in _TOPIC_KEYWORD_PATTERN.finditer(text_lower):
+            found.update(_TOPIC_KEYWORD_PREFIXES[match.group(1)])
+        if not found:
+            return None
 
         for topic, keywords in TOPIC_KEYWORDS.items():
-            matches = sum(1 for kw in keywords if kw in text_lower)
+            matches = sum(1 for kw in keywords if kw in found)
             # Require at least 2 keyword matches for confidence
             if matches >= 2:
                 return topic
@@ -448,6 +489,7 @@ class ChecklistAgent:
         speaker_role: str,
         text: str,
         conversation_history: list[dict[str, Any]],
+        text_lower: Optional[str] = None,
     ) -> Optional[dict[str, Any]]:
         """
         Analyze the conversation turn to determine if checklist should be updated.
@@ -457,6 +499,7 @@ class ChecklistAgent:
             speaker_role: "interviewer" or "candidate"
             text: The spoken text
             conversation_history: List of previous conversation turns
+            text_lower: Precomputed ``text.lower()``, if the caller has one
 
         Returns:
             dict with {item, status, reason} if update needed, None otherwise
@@ -465,7 +508,7 @@ class ChecklistAgent:
             return None
 
         # Quick keyword check for efficiency
-        quick_topic = self._quick_topic_detection(text)
+        quick_topic = self._quick_topic_detection(text, text_lower)
         if quick_topic:
             # If interviewer starts a new topic, mark as analyzing
             if speaker_role == "interviewer" and quick_topic != self._current_topic:
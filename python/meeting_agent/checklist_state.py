@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+import re
 from dataclasses import dataclass
 from datetime import datetime, timezone
 from enum import Enum
@@ -16,7 +17,7 @@ class ChecklistStatus(str, Enum):
     COMPLETE = "complete"
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class ChecklistDefinition:
     """Checklist definition for one item."""
 
@@ -53,6 +54,17 @@ class ChecklistStateManager:
         }
         self._id_by_label = {item.label.strip().lower(): item.id for item in self._definitions}
 
+        # One lookahead alternation over every keyword, listed in definition
+        # order, so a single scan finds the earliest-defined item with a hit.
+        self._item_index_by_keyword: dict[str, int] = {}
+        for index, item in enumerate(self._definitions):
+            for keyword in item.keywords:
+                self._item_index_by_keyword.setdefault(keyword.lower(), index)
+        self._keyword_pattern: re.Pattern[str] | None = None
+        if self._item_index_by_keyword:
+            alternation = "|".join(map(re.escape, self._item_index_by_keyword))
+            self._keyword_pattern = re.compile(f"(?=({alternation}))")
+
     def reset(self) -> None:
         """Reset all checklist items to pending."""
         self._state = {item.id: ChecklistItemState() for item in self._definitions}
@@ -92,33 +104,60 @@ class ChecklistStateManager:
         current.source = source
         return True
 
-    def apply_alfred_heuristic(self, text: str, speaker_role: str) -> bool:
-        """Apply current baseline checklist behavior from transcript text."""
+    def _match_item(self, text_lower: str) -> ChecklistDefinition | None:
+        """Return the first-defined item with any keyword in ``text_lower``.
+
+        At each position the alternation reports the earliest-listed keyword,
+        so a later item can only be shadowed by an earlier one; the minimum
+        index over all reported hits is therefore the first matching item.
+        """
+        if self._keyword_pattern is None:
+            return None
+        index = min(
+            (
+                self._item_index_by_keyword[match.group(1)]
+                for match in self._keyword_pattern.finditer(text_lower)
+            ),
+            default=None,
+        )
+        return self._definitions[index] if index is not None else None
+
+    def apply_alfred_heuristic(
+        self,
+        text: str,
+        speaker_role: str,
+        text_lower: str | None = None,
+    ) -> bool:
+        """Apply current baseline checklist behavior from transcript text.
+
+        Callers that already lowercased ``text`` can pass ``text_lower`` to
+        avoid lowercasing it again.
+        """
         if not text:
             return False
 
-        text_lower = text.lower()
-        for item in self._definitions:
-            if any(keyword.lower() in text_lower for keyword in item.keywords):
-                item_state = self._state[item.id]
-                if item_state.status == ChecklistStatus.PENDING:
-                    return self.update(
-                        item=item.id,
-                        status=ChecklistStatus.ANALYZING,
-                        reason="Keyword hit while topic is being discussed",
-                        source="heuristic",
-                    )
-                if (
-                    item_state.status == ChecklistStatus.ANALYZING
-                    and speaker_role == "candidate"
-                ):
-                    return self.update(
-                        item=item.id,
-                        status=ChecklistStatus.COMPLETE,
-                        reason="Candidate response completed active topic",
-                        source="heuristic",
-                    )
-                return False
+        item = self._match_item(text_lower if text_lower is not None else text.lower())
+        if item is None:
+            return False
+
+        item_state = self._state[item.id]
+        if item_state.status == ChecklistStatus.PENDING:
+            return self.update(
+                item=item.id,
+                status=ChecklistStatus.ANALYZING,
+                reason="Keyword hit while topic is being discussed",
+                source="heuristic",
+            )
+        if (
+            item_state.status == ChecklistStatus.ANALYZING
+            and speaker_role == "candidate"
+        ):
+            return self.update(
+                item=item.id,
+                status=ChecklistStatus.COMPLETE,
+                reason="Candidate response completed active topic",
+                source="heuristic",
+            )
         return False
 
     def snapshot(self) -> list[dict[str, str | None]]:
@@ -51,6 +51,7 @@ AlfredEventType = Literal[
     "dossier_upsert",
     "tool_call",
     "session_state",
+    "analysis_item",
     "session_started",
     "session_ended",
     "heartbeat",
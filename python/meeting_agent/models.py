@@ -8,14 +8,16 @@ meeting-chat sends are side effects produced by tool calls (see
 enum in the extraction payload.
 """
 
-from datetime import datetime, timezone
+import time
 from typing import Literal, Optional
 
 from pydantic import BaseModel, Field
 
 
 def utc_now_iso() -> str:
-    return datetime.now(timezone.utc).isoformat().replace("+00:00", "Z")
+    """Format the current UTC time as ISO-8601 with microseconds and a Z suffix."""
+    seconds, micros = divmod(time.time_ns() // 1_000, 1_000_000)
+    return f"{time.strftime('%Y-%m-%dT%H:%M:%S', time.gmtime(seconds))}.{micros:06d}Z"
 
 
 # ---------------------------------------------------------------------------
@@ -26,6 +28,8 @@ def utc_now_iso() -> str:
 class EventMetadata(BaseModel):
     """Optional metadata attached to transcript events."""
 
+    model_config = {"frozen": True}
+
     meeting_id: Optional[str] = None
     call_id: Optional[str] = None
     raw_response: Optional[dict] = None
@@ -67,6 +71,8 @@ class TranscriptEvent(BaseModel):
 class SpeakerMapping(BaseModel):
     """Maps a speaker ID to a role in the meeting."""
 
+    model_config = {"frozen": True}
+
     speaker_id: str
     role: str = Field(..., description="Role: 'candidate', 'interviewer', 'participant', 'bot'")
     name: Optional[str] = None
@@ -526,15 +532,22 @@ class SessionAnalysis(BaseModel):
     def compute_overall_scores(self) -> None:
         """Compute overall scores from scored analysis items (no-op for Alfred items)."""
 
-        scored = [
-            item
-            for item in self.analysis_items
-            if item.relevance_score is not None and item.clarity_score is not None
-        ]
+        # One pass accumulates both sums without building a filtered list.
+        scored = 0
+        relevance_total = 0
+        clarity_total = 0
+        for item in self.analysis_items:
+            relevance = item.relevance_score
+            clarity = item.clarity_score
+            if relevance is None or clarity is None:
+                continue
+            scored += 1
+            relevance_total += relevance
+            clarity_total += clarity
         self.total_responses_analyzed = len(self.analysis_items)
         if not scored:
             self.overall_relevance = None
             self.overall_clarity = None
             return
-        self.overall_relevance = sum(i.relevance_score for i in scored) / len(scored)
-        self.overall_clarity = sum(i.clarity_score for i in scored) / len(scored)
+        self.overall_relevance = relevance_total / scored
+        self.overall_clarity = clarity_total / scored
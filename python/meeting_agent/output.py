@@ -10,13 +10,14 @@ Thread Safety:
 Last Grunted: 02/05/2026
 """
 
-import json
 import logging
+import os
 from datetime import datetime, timezone
 from pathlib import Path
 from typing import Optional
 
 from pydantic import ValidationError
+from pydantic_core import from_json, to_json
 
 from .models import AnalysisItem, SessionAnalysis
 
@@ -26,6 +27,11 @@ __all__ = ["AnalysisOutputWriter", "OutputWriteError", "OutputReadError"]
 
 logger = logging.getLogger(__name__)
 
+# Per-session caches keep only this many recently used sessions: the live
+# session plus a few pollers of ended ones, not every session the
+# long-running sink has ever written.
+MAX_CACHED_SESSIONS = 4
+
 
 class OutputWriteError(Exception):
     """Raised when writing analysis output fails."""
@@ -67,6 +73,42 @@ def _merge_by_id(data: dict, key: str, incoming: list[dict]) -> None:
     data[key] = list(by_id.values())[-200:]
 
 
+def _write_atomic(path: Path, payload: bytes) -> None:
+    """Write ``payload`` to a sibling temp file and rename it over ``path``.
+
+    Readers see either the old file or the new one, never a partial write.
+    No fsync: this guards against torn reads, not power loss.
+    """
+    tmp_path = path.with_name(path.name + ".tmp")
+    tmp_path.write_bytes(payload)
+    os.replace(tmp_path, path)
+
+
+def _cache_put(cache: dict, session_id: str, entry: tuple) -> None:
+    """Store ``entry`` as the most recently used, evicting the oldest past the cap."""
+    cache.pop(session_id, None)
+    cache[session_id] = entry
+    while len(cache) > MAX_CACHED_SESSIONS:
+        del cache[next(iter(cache))]
+
+
+def _score_totals(
+    items: list[dict],
+    totals: tuple[int, float, float] = (0, 0.0, 0.0),
+) -> tuple[int, float, float]:
+    """Add scored items to ``(scored_count, relevance_sum, clarity_sum)``."""
+    scored_count, relevance_total, clarity_total = totals
+    for item in items:
+        relevance = item.get("relevance_score")
+        clarity = item.get("clarity_score")
+        if relevance is None or clarity is None:
+            continue
+        scored_count += 1
+        relevance_total += float(relevance)
+        clarity_total += float(clarity)
+    return scored_count, relevance_total, clarity_total
+
+
 class AnalysisOutputWriter:
     """
     Writes interview analysis results to JSON files.
@@ -91,6 +133,17 @@ class AnalysisOutputWriter:
                        Created if it doesn't exist.
         """
         self.output_dir = Path(output_dir)
+        # session_id -> ((st_mtime_ns, st_size), parsed analysis), bounded
+        # to the MAX_CACHED_SESSIONS most recently loaded sessions.
+        self._load_cache: dict[str, tuple[tuple[int, int], SessionAnalysis]] = {}
+        # session_id -> ((st_mtime_ns, st_size), raw snapshot dict, score
+        # totals) as last written by append_item, so the next append skips
+        # re-reading the file and re-summing every item's scores. Bounded to
+        # MAX_CACHED_SESSIONS; write_analysis (including the end-of-session
+        # finalize) drops the session's entry.
+        self._append_cache: dict[
+            str, tuple[tuple[int, int], dict, tuple[int, float, float]]
+        ] = {}
         self._ensure_output_dir()
     
     def _ensure_output_dir(self) -> None:
@@ -137,6 +190,8 @@ class AnalysisOutputWriter:
             PosixPath('./output/int_20260131_103000_analysis.json')
         """
         output_path = self._get_output_path(session_id)
+        self._load_cache.pop(session_id, None)
+        self._append_cache.pop(session_id, None)
         
         # Compute overall scores before writing
         analysis.compute_overall_scores()
@@ -149,8 +204,7 @@ class AnalysisOutputWriter:
         }
         
         try:
-            with open(output_path, "w", encoding="utf-8") as f:
-                json.dump(data, f, indent=2, ensure_ascii=False)
+            _write_atomic(output_path, to_json(data, indent=2))
         except OSError as e:
             raise OutputWriteError(output_path, e) from e
         
@@ -191,13 +245,29 @@ class AnalysisOutputWriter:
         """
         output_path = self._get_output_path(session_id)
         current_timestamp = _format_utc_timestamp()
+        self._load_cache.pop(session_id, None)
+        cached = self._append_cache.pop(session_id, None)
         
-        # Load existing data or create minimal structure
-        if output_path.exists():
+        try:
+            stat = output_path.stat()
+        except FileNotFoundError:
+            stat = None
+        except OSError as e:
+            raise OutputReadError(output_path, e) from e
+        
+        # Reuse our own last write unless the file changed since; otherwise
+        # load existing data or create minimal structure.
+        totals: Optional[tuple[int, float, float]] = None
+        if (
+            stat is not None
+            and cached is not None
+            and cached[0] == (stat.st_mtime_ns, stat.st_size)
+        ):
+            data, totals = cached[1], cached[2]
+        elif stat is not None:
             try:
-                with open(output_path, "r", encoding="utf-8") as f:
-                    data = json.load(f)
-            except json.JSONDecodeError as e:
+                data = from_json(output_path.read_bytes())
+            except ValueError as e:
                 raise OutputReadError(output_path, e) from e
             except OSError as e:
                 raise OutputReadError(output_path, e) from e
@@ -246,20 +316,17 @@ class AnalysisOutputWriter:
             _merge_by_id(data, "action_items", [a.model_dump() for a in extraction.action_items])
             _merge_by_id(data, "risks", [r.model_dump() for r in extraction.risks])
 
-        # Recompute overall scores using only scored items.
-        scored_items = [
-            analysis_item
-            for analysis_item in data["analysis_items"]
-            if analysis_item.get("relevance_score") is not None
-            and analysis_item.get("clarity_score") is not None
-        ]
-        if scored_items:
-            data["overall_relevance"] = (
-                sum(float(i["relevance_score"]) for i in scored_items) / len(scored_items)
-            )
-            data["overall_clarity"] = (
-                sum(float(i["clarity_score"]) for i in scored_items) / len(scored_items)
-            )
+        # Overall scores use only scored items. Running totals are kept in
+        # memory with the cached dict, so each append adds one item instead
+        # of re-summing all of them; a fresh read recomputes them.
+        if totals is None:
+            totals = _score_totals(data["analysis_items"])
+        else:
+            totals = _score_totals(data["analysis_items"][-1:], totals)
+        scored_count, relevance_total, clarity_total = totals
+        if scored_count:
+            data["overall_relevance"] = relevance_total / scored_count
+            data["overall_clarity"] = clarity_total / scored_count
         else:
             data["overall_relevance"] = None
             data["overall_clarity"] = None
@@ -268,21 +335,65 @@ class AnalysisOutputWriter:
             data["checklist_state"] = checklist_state
         
         # Update metadata
-        data["_meta"]["last_updated_at"] = current_timestamp
+        meta = data.setdefault("_meta", {})
+        meta["last_updated_at"] = current_timestamp
         
         try:
-            with open(output_path, "w", encoding="utf-8") as f:
-                json.dump(data, f, indent=2, ensure_ascii=False)
+            _write_atomic(output_path, to_json(data, indent=2))
+            stat = output_path.stat()
         except OSError as e:
             raise OutputWriteError(output_path, e) from e
+        _cache_put(
+            self._append_cache,
+            session_id,
+            ((stat.st_mtime_ns, stat.st_size), data, totals),
+        )
         
         logger.info("Appended item %s to %s", item.response_id, output_path)
         return output_path
     
+    def _load_cached(self, session_id: str) -> Optional[SessionAnalysis]:
+        """Return the cached parse of the session file, refreshing it if the file changed.
+        
+        The returned model is shared with the cache and must not be mutated.
+        """
+        output_path = self._get_output_path(session_id)
+        
+        try:
+            stat = output_path.stat()
+        except FileNotFoundError:
+            self._load_cache.pop(session_id, None)
+            logger.debug("No analysis file found for session %s", session_id)
+            return None
+        except OSError as e:
+            raise OutputReadError(output_path, e) from e
+        
+        signature = (stat.st_mtime_ns, stat.st_size)
+        cached = self._load_cache.get(session_id)
+        if cached is not None and cached[0] == signature:
+            _cache_put(self._load_cache, session_id, cached)
+            return cached[1]
+        
+        # Validate straight from the bytes: no intermediate dict, and the
+        # ``_meta`` block is dropped as an unknown field.
+        try:
+            analysis = SessionAnalysis.model_validate_json(output_path.read_bytes())
+        except ValidationError as e:
+            raise OutputReadError(output_path, e) from e
+        except OSError as e:
+            raise OutputReadError(output_path, e) from e
+        
+        _cache_put(self._load_cache, session_id, (signature, analysis))
+        return analysis
+    
     def load_analysis(self, session_id: str) -> Optional[SessionAnalysis]:
         """
         Load an existing analysis from file.
         
+        The parsed result is cached against the file's mtime and size, so
+        repeated loads of an unchanged file skip reading and validation and
+        return a deep copy of the cached analysis.
+        
         Args:
             session_id: The session identifier.
             
@@ -292,27 +403,42 @@ class AnalysisOutputWriter:
         Raises:
             OutputReadError: If file read fails or contains invalid JSON/data.
         """
-        output_path = self._get_output_path(session_id)
-        
-        if not output_path.exists():
-            logger.debug("No analysis file found for session %s", session_id)
-            return None
+        analysis = self._load_cached(session_id)
+        return analysis.model_copy(deep=True) if analysis is not None else None
+    
+    def load_analysis_since(
+        self,
+        session_id: str,
+        since: int = 0,
+    ) -> tuple[Optional[SessionAnalysis], int]:
+        """
+        Load an analysis holding only the items after the first ``since``.
         
-        try:
-            with open(output_path, "r", encoding="utf-8") as f:
-                data = json.load(f)
-        except json.JSONDecodeError as e:
-            raise OutputReadError(output_path, e) from e
-        except OSError as e:
-            raise OutputReadError(output_path, e) from e
+        Only the returned tail of ``analysis_items`` is copied out of the
+        load cache, so a poller that already holds most items pays for the
+        new ones rather than the whole session.
         
-        # Remove metadata before parsing
-        data.pop("_meta", None)
+        Args:
+            session_id: The session identifier.
+            since: Number of leading items the caller already has.
+            
+        Returns:
+            Tuple of (analysis with the item tail, or None if no file exists;
+            total number of items in the session).
+            
+        Raises:
+            OutputReadError: If file read fails or contains invalid JSON/data.
+        """
+        cached = self._load_cached(session_id)
+        if cached is None:
+            return None, 0
         
-        try:
-            return SessionAnalysis.model_validate(data)
-        except ValidationError as e:
-            raise OutputReadError(output_path, e) from e
+        items = cached.analysis_items
+        analysis = cached.model_copy(update={"analysis_items": []}).model_copy(deep=True)
+        analysis.analysis_items = [
+            item.model_copy(deep=True) for item in items[max(since, 0):]
+        ]
+        return analysis, len(items)
     
     def list_sessions(self) -> list[str]:
         """
@@ -323,13 +449,15 @@ class AnalysisOutputWriter:
         """
         self._ensure_output_dir()
         
-        session_ids = []
-        for path in self.output_dir.glob("*_analysis.json"):
-            # Extract session_id from filename
-            session_id = path.stem.replace("_analysis", "")
-            session_ids.append(session_id)
-        
-        return sorted(session_ids)
+        # One scandir pass: entry types come from the directory listing, so
+        # there is no per-file stat or fnmatch.
+        suffix = "_analysis.json"
+        with os.scandir(self.output_dir) as entries:
+            return sorted(
+                entry.name[: -len(suffix)]
+                for entry in entries
+                if entry.name.endswith(suffix) and entry.is_file()
+            )
     
     def delete_analysis(self, session_id: str) -> bool:
         """
@@ -345,14 +473,17 @@ class AnalysisOutputWriter:
             OutputWriteError: If file deletion fails due to permissions or other OS error.
         """
         output_path = self._get_output_path(session_id)
+        self._load_cache.pop(session_id, None)
+        self._append_cache.pop(session_id, None)
         
-        if not output_path.exists():
-            logger.debug("No analysis file to delete for session %s", session_id)
-            return False
-        
+        # Unlink directly rather than exists() + unlink(): one syscall.
         try:
             output_path.unlink()
-            logger.info("Deleted analysis file for session %s", session_id)
-            return True
+        except FileNotFoundError:
+            logger.debug("No analysis file to delete for session %s", session_id)
+            return False
         except OSError as e:
             raise OutputWriteError(output_path, e) from e
+        
+        logger.info("Deleted analysis file for session %s", session_id)
+        return True
@@ -21,6 +21,7 @@ from __future__ import annotations
 import asyncio
 import json
 import logging
+from collections import deque
 from dataclasses import dataclass, field
 from datetime import datetime, timezone
 from enum import Enum
@@ -61,7 +62,7 @@ def _get_utc_timestamp() -> str:
     return datetime.now(timezone.utc).isoformat().replace("+00:00", "Z")
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class AgentThought:
     """
     A single thought/update from the agent.
@@ -94,6 +95,7 @@ class AgentThought:
     key_points: list[str] = field(default_factory=list)
     follow_up_suggestions: list[str] = field(default_factory=list)
     running_assessment: dict[str, object] | None = None
+    _json: str | None = field(default=None, init=False, repr=False, compare=False)
 
     def to_dict(self) -> dict[str, object]:
         """
@@ -120,10 +122,15 @@ class AgentThought:
         """
         Convert thought to JSON string.
 
+        The string is built once and reused for every subscriber it is sent
+        to; the dataclass is frozen, so the memo cannot go stale.
+
         Returns:
             JSON string representation of the thought.
         """
-        return json.dumps(self.to_dict())
+        if self._json is None:
+            object.__setattr__(self, "_json", json.dumps(self.to_dict()))
+        return self._json
 
 
 class AgentThoughtPublisher:
@@ -160,7 +167,7 @@ class AgentThoughtPublisher:
             max_history: Maximum number of thoughts to retain in history.
         """
         self._subscribers: list[asyncio.Queue[AgentThought]] = []
-        self._history: list[AgentThought] = []
+        self._history: deque[AgentThought] = deque(maxlen=max_history)
         self._max_history = max_history
         self._lock = asyncio.Lock()
         logger.info("AgentThoughtPublisher initialized with max_history=%d", max_history)
@@ -178,9 +185,10 @@ class AgentThoughtPublisher:
         queue: asyncio.Queue[AgentThought] = asyncio.Queue()
         async with self._lock:
             self._subscribers.append(queue)
-            # Send history to new subscriber
+            # Send history to new subscriber; the queue is unbounded, so
+            # put_nowait never blocks and needs no await per thought.
             for thought in self._history:
-                await queue.put(thought)
+                queue.put_nowait(thought)
         logger.debug("New subscriber added. Total: %d", len(self._subscribers))
         return queue
 
@@ -206,20 +214,41 @@ class AgentThoughtPublisher:
             thought: The thought to publish.
         """
         async with self._lock:
-            # Store in history
+            # Store in history; the deque evicts the oldest thought itself.
             self._history.append(thought)
-            if len(self._history) > self._max_history:
-                self._history = self._history[-self._max_history :]
 
-            # Broadcast to all subscribers
+            # Broadcast to all subscribers (unbounded queues, as above)
             for queue in self._subscribers:
                 try:
-                    await queue.put(thought)
+                    queue.put_nowait(thought)
                 except Exception as e:
                     logger.warning("Failed to publish to subscriber: %s", e)
 
         logger.debug("Published thought: %s", thought.thought_type.value)
 
+    async def publish_many(self, thoughts: Sequence[AgentThought]) -> None:
+        """
+        Publish a burst of thoughts in order under a single lock acquisition.
+
+        Subscribers receive the same individual thoughts as from repeated
+        ``publish`` calls.
+
+        Args:
+            thoughts: The thoughts to publish, oldest first.
+        """
+        if not thoughts:
+            return
+        async with self._lock:
+            self._history.extend(thoughts)
+            for queue in self._subscribers:
+                try:
+                    for thought in thoughts:
+                        queue.put_nowait(thought)
+                except Exception as e:
+                    logger.warning("Failed to publish to subscriber: %s", e)
+
+        logger.debug("Published %d thoughts", len(thoughts))
+
     async def publish_analysis(
         self,
         content: str,
@@ -15,6 +15,8 @@ Last Grunted: 02/05/2026
 import logging
 import uuid
 from datetime import datetime, timedelta, timezone
+from functools import lru_cache
+from itertools import islice
 from typing import Any, Optional
 
 from .models import (
@@ -46,6 +48,25 @@ DOMINANT_SPEAKER_SHARE = 0.68
 MAX_OUTBOUND_INTENTS = 24
 BOT_ECHO_WINDOW_SECONDS = 180
 
+# get_session_context keys echoed into the agent's cache-stable prompt prefix.
+STABLE_PREFIX_KEYS = (
+    "session_id",
+    "candidate_name",
+    "meeting_url",
+    "started_at",
+    "speaker_mappings",
+    "prompt_cache_key",
+    "latest_response_id",
+    "running_summary",
+    "topics",
+    "notes",
+    "decisions",
+    "open_questions",
+    "action_items",
+    "risks",
+    "alfred_muted",
+)
+
 
 def _format_utc_timestamp(dt: datetime) -> str:
     """
@@ -60,8 +81,13 @@ def _format_utc_timestamp(dt: datetime) -> str:
     return dt.isoformat().replace("+00:00", "Z")
 
 
+@lru_cache(maxsize=1024)
 def _parse_utc_timestamp(timestamp: str | None) -> Optional[datetime]:
-    """Parse ISO UTC timestamps that may use a trailing 'Z'."""
+    """Parse ISO UTC timestamps that may use a trailing 'Z'.
+
+    Memoized: the same ledger and intent timestamps are re-parsed on every
+    incoming event, and the returned datetimes are immutable.
+    """
     if not timestamp:
         return None
     try:
@@ -186,6 +212,14 @@ class InterviewSessionManager:
         """Initialize the session manager without an active session."""
         self._session: Optional[InterviewSession] = None
         self._speaker_roles: dict[str, str] = {}  # speaker_id -> role
+        # First speaker mapped as candidate; refreshed by map_speaker.
+        self._candidate_speaker_id: Optional[str] = None
+        # (message_id, event_type) -> chat message, for O(1) duplicate checks
+        self._chat_message_index: dict[tuple[str, str], ChatMessage] = {}
+        # Final transcript events, overall and per speaker, so tail lookups
+        # do not rescan every partial in the session.
+        self._final_transcripts: list[TranscriptEvent] = []
+        self._final_transcripts_by_speaker: dict[str, list[TranscriptEvent]] = {}
         logger.debug("InterviewSessionManager initialized")
     
     @property
@@ -248,6 +282,10 @@ class InterviewSessionManager:
         if chat_thread_id:
             self._session.conversation_reference_id = chat_thread_id
         self._speaker_roles = {}
+        self._candidate_speaker_id = None
+        self._chat_message_index = {}
+        self._final_transcripts = []
+        self._final_transcripts_by_speaker = {}
 
         logger.info(
             "Started session %s for candidate '%s' (chat_thread_id=%s)",
@@ -309,6 +347,10 @@ class InterviewSessionManager:
         
         # Update internal mapping
         self._speaker_roles[speaker_id] = role
+        self._candidate_speaker_id = next(
+            (sid for sid, mapped in self._speaker_roles.items() if mapped == "candidate"),
+            None,
+        )
         
         # Update session's speaker mappings
         # Remove existing mapping for this speaker_id if present
@@ -344,10 +386,7 @@ class InterviewSessionManager:
             >>> manager.get_candidate_speaker_id()
             'speaker_1'
         """
-        return next(
-            (sid for sid, role in self._speaker_roles.items() if role == "candidate"),
-            None,
-        )
+        return self._candidate_speaker_id
     
     def get_speaker_role(self, speaker_id: str) -> Optional[str]:
         """
@@ -591,6 +630,10 @@ class InterviewSessionManager:
             raise ValueError("No active session. Call start_session() first.")
 
         self._session.transcript_events.append(event)
+        if event.event_type == "final":
+            self._final_transcripts.append(event)
+            if event.speaker_id is not None:
+                self._final_transcripts_by_speaker.setdefault(event.speaker_id, []).append(event)
 
         if event.event_type == "final" and event.text and event.text.strip():
             metadata = event.metadata
@@ -647,11 +690,8 @@ class InterviewSessionManager:
         if self._session is None:
             return []
         
-        events = self._session.transcript_events
-        if final_only:
-            events = [e for e in events if e.event_type == "final"]
-        
-        return events[-count:] if len(events) > count else events
+        events = self._final_transcripts if final_only else self._session.transcript_events
+        return events[-count:] if len(events) > count else list(events)
     
     def get_candidate_transcripts(
         self,
@@ -672,18 +712,17 @@ class InterviewSessionManager:
         if candidate_id is None or self._session is None:
             return []
         
-        events = [
-            e for e in self._session.transcript_events
-            if e.speaker_id == candidate_id
-        ]
-        
         if final_only:
-            events = [e for e in events if e.event_type == "final"]
-        
-        if count is not None:
-            events = events[-count:] if len(events) > count else events
+            events = self._final_transcripts_by_speaker.get(candidate_id, [])
+        else:
+            events = [
+                e for e in self._session.transcript_events
+                if e.speaker_id == candidate_id
+            ]
         
-        return events
+        if count is not None and len(events) > count:
+            return events[-count:]
+        return list(events)
 
     def get_recent_conversation(self, count: int = 10) -> list[dict[str, str | None]]:
         """
@@ -691,21 +730,28 @@ class InterviewSessionManager:
         """
         if self._session is None:
             return []
-        conversation: list[dict[str, str | None]] = []
 
-        for event in self._session.meeting_events:
-            if event.kind != "speech" or not event.text.strip():
-                continue
-
-            turn: dict[str, str | None] = {
+        # Walk back from the newest event and stop once ``count`` turns are
+        # found, so status polls cost O(count) rather than O(session length).
+        turns = (
+            {
                 "speaker_id": event.speaker_id,
                 "role": event.role or "unknown",
-                "text": event.text.strip(),
+                "text": text,
                 "timestamp": event.timestamp_utc,
             }
-            conversation.append(turn)
-
-        return conversation[-count:] if len(conversation) > count else conversation
+            for event in reversed(self._session.meeting_events)
+            if event.kind == "speech" and (text := event.text.strip())
+        )
+        if count <= 0:
+            # Keep list-slice semantics: [-0:] is every turn, [-n:] with a
+            # negative count drops the oldest |count| turns.
+            conversation: list[dict[str, str | None]] = list(turns)
+            conversation.reverse()
+            return conversation[-count:]
+        conversation = list(islice(turns, count))
+        conversation.reverse()
+        return conversation
 
     def infer_candidate_speaker_id(self, count: int = 12) -> Optional[str]:
         """
@@ -814,10 +860,7 @@ class InterviewSessionManager:
             "risks": [r.model_dump() for r in self._session.risks],
             "alfred_muted": self._session.alfred_muted,
             "total_events": len(self._session.transcript_events),
-            "final_events": len([
-                e for e in self._session.transcript_events
-                if e.event_type == "final"
-            ]),
+            "final_events": len(self._final_transcripts),
         }
 
     def get_agent_context_snapshot(
@@ -836,22 +879,11 @@ class InterviewSessionManager:
         dynamic_tail = [event.model_dump() for event in self.get_recent_events_since_cursor()]
         return {
             **session_context,
+            # The prefix reuses the values session_context just built rather
+            # than dumping the rolling state a second time; both are read-only.
             "stable_prefix": {
-                "session_id": self._session.session_id,
-                "candidate_name": self._session.candidate_name,
-                "meeting_url": self._session.meeting_url,
-                "started_at": self._session.started_at,
-                "speaker_mappings": dict(self._speaker_roles),
-                "prompt_cache_key": self._session.prompt_cache_key,
-                "latest_response_id": self._session.latest_response_id,
-                "running_summary": self._session.running_summary,
-                "topics": list(self._session.topics),
-                "notes": list(self._session.notes),
-                "decisions": [d.model_dump() for d in self._session.decisions],
-                "open_questions": [q.model_dump() for q in self._session.open_questions],
-                "action_items": [a.model_dump() for a in self._session.action_items],
-                "risks": [r.model_dump() for r in self._session.risks],
-                "alfred_muted": self._session.alfred_muted,
+                key: session_context[key]
+                for key in STABLE_PREFIX_KEYS
             },
             "dynamic_tail": dynamic_tail,
             "trigger_event": trigger_event.model_dump() if trigger_event else None,
@@ -880,12 +912,8 @@ class InterviewSessionManager:
             return None
         
         # Search backwards for last interviewer statement
-        for event in reversed(self._session.transcript_events):
-            if (
-                event.event_type == "final"
-                and event.speaker_id in interviewer_ids
-                and event.text
-            ):
+        for event in reversed(self._final_transcripts):
+            if event.speaker_id in interviewer_ids and event.text:
                 return event.text
 
         return None
@@ -907,25 +935,24 @@ class InterviewSessionManager:
         if self._session is None:
             raise ValueError("No active session. Call start_session() first.")
 
-        for existing in self._session.chat_messages:
+        key = (message.message_id, message.event_type)
+        existing = self._chat_message_index.get(key)
+        if existing is not None:
             if (
-                existing.message_id == message.message_id
-                and existing.event_type == message.event_type
+                message.conversation_reference_id
+                and existing.conversation_reference_id is None
             ):
-                if (
-                    message.conversation_reference_id
-                    and existing.conversation_reference_id is None
-                ):
-                    existing.conversation_reference_id = message.conversation_reference_id
-                if message.raw is not None and existing.raw is None:
-                    existing.raw = message.raw
-                if message.html and not existing.html:
-                    existing.html = message.html
-                if message.text and not existing.text:
-                    existing.text = message.text
-                return None
+                existing.conversation_reference_id = message.conversation_reference_id
+            if message.raw is not None and existing.raw is None:
+                existing.raw = message.raw
+            if message.html and not existing.html:
+                existing.html = message.html
+            if message.text and not existing.text:
+                existing.text = message.text
+            return None
 
         self._session.chat_messages.append(message)
+        self._chat_message_index[key] = message
 
         if self._session.graph_chat_thread_id is None:
             self._session.graph_chat_thread_id = message.chat_thread_id
@@ -975,8 +1002,10 @@ class InterviewSessionManager:
         if self._session is None:
             return []
 
-        entries = [event.model_dump() for event in self._session.meeting_events]
-        return entries[-count:] if count is not None and len(entries) > count else entries
+        events = self._session.meeting_events
+        if count is not None and len(events) > count:
+            events = events[-count:]
+        return [event.model_dump() for event in events]
 
 
 # ---------------------------------------------------------------------------
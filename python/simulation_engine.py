@@ -18,15 +18,18 @@ Usage:
 from __future__ import annotations
 
 import asyncio
+import itertools
 import logging
 import random
 import threading
 from dataclasses import dataclass
-from datetime import datetime, timezone
 from enum import Enum
-from typing import Final
+from typing import Final, NamedTuple
 
 import httpx
+from pydantic_core import to_json
+
+from meeting_agent.models import utc_now_iso
 
 logging.basicConfig(
     level=logging.INFO,
@@ -43,6 +46,15 @@ SINK_URL: Final[str] = "http://127.0.0.1:8765"
 CANDIDATE_NAME: Final[str] = "Sarah Chen"
 MEETING_URL: Final[str] = "https://teams.microsoft.com/l/meetup-join/simulated-interview-session"
 
+# HTTP client configuration (one pooled keep-alive connection set per run)
+HTTP_TIMEOUT_SECONDS: Final[float] = 10.0
+HTTP_LIMITS: Final[httpx.Limits] = httpx.Limits(
+    max_connections=100,
+    max_keepalive_connections=20,
+)
+# Bodies are pre-encoded to UTF-8 bytes with pydantic-core's Rust serializer
+JSON_HEADERS: Final[dict[str, str]] = {"content-type": "application/json"}
+
 # Speaker IDs (matching diarization format)
 INTERVIEWER_ID: Final[str] = "speaker_0"
 CANDIDATE_ID: Final[str] = "speaker_1"
@@ -63,52 +75,84 @@ MAX_CONFIDENCE: Final[float] = 0.98
 PAUSE_BETWEEN_MESSAGES_MS: Final[float] = 500.0
 DELAY_JITTER_RANGE: Final[float] = 0.5
 
+# Spans for drawing uniform values as ``low + random() * span`` (same draws as uniform)
+DURATION_JITTER_SPAN_MS: Final[float] = MAX_DURATION_JITTER_MS - MIN_DURATION_JITTER_MS
+CONFIDENCE_SPAN: Final[float] = MAX_CONFIDENCE - MIN_CONFIDENCE
+INTERVIEWER_DELAY_SPAN: Final[float] = INTERVIEWER_DELAY_MAX - INTERVIEWER_DELAY_MIN
+
+# Fixed seed so every run replays the same pacing, jitter, and confidence values
+DEFAULT_SIMULATION_SEED: Final[int] = 0xC0FFEE
+
+
+class ScriptLine(NamedTuple):
+    """One scripted utterance; unpacks as ``(speaker_id, text)``."""
+
+    speaker_id: str
+    text: str
+
 
 # =============================================================================
 # Interview Script (20 messages)
 # =============================================================================
 
-INTERVIEW_SCRIPT = [
+INTERVIEW_SCRIPT: Final[tuple[ScriptLine, ...]] = (
     # Message 1-2: Opening
-    (INTERVIEWER_ID, "Good morning Sarah, thanks for joining us today. I'm David, the Engineering Manager. Before we dive in, how are you doing today?"),
-    (CANDIDATE_ID, "Good morning David! I'm doing great, thank you for asking. I'm really excited about this opportunity and looking forward to our conversation."),
+    ScriptLine(INTERVIEWER_ID, "Good morning Sarah, thanks for joining us today. I'm David, the Engineering Manager. Before we dive in, how are you doing today?"),
+    ScriptLine(CANDIDATE_ID, "Good morning David! I'm doing great, thank you for asking. I'm really excited about this opportunity and looking forward to our conversation."),
     
     # Message 3-4: Background
-    (INTERVIEWER_ID, "Wonderful. Let's start with your background. Can you walk me through your experience with Python and tell me about a project you're particularly proud of?"),
-    (CANDIDATE_ID, "Absolutely. I've been working with Python for about six years now, primarily in backend development. The project I'm most proud of is a real-time data pipeline I built at my current company. We were processing clickstream data from our e-commerce platform, handling about 50,000 events per second. I designed the architecture using Apache Kafka for ingestion and built custom consumers in Python with asyncio. The system reduced our data latency from hours to under 30 seconds."),
+    ScriptLine(INTERVIEWER_ID, "Wonderful. Let's start with your background. Can you walk me through your experience with Python and tell me about a project you're particularly proud of?"),
+    ScriptLine(CANDIDATE_ID, "Absolutely. I've been working with Python for about six years now, primarily in backend development. The project I'm most proud of is a real-time data pipeline I built at my current company. We were processing clickstream data from our e-commerce platform, handling about 50,000 events per second. I designed the architecture using Apache Kafka for ingestion and built custom consumers in Python with asyncio. The system reduced our data latency from hours to under 30 seconds."),
     
     # Message 5-6: Technical deep dive
-    (INTERVIEWER_ID, "That's impressive throughput. How did you handle failures and ensure data consistency in that pipeline?"),
-    (CANDIDATE_ID, "Great question. We implemented several layers of reliability. First, Kafka's built-in replication handled broker failures. For our consumers, I used idempotent processing with deduplication based on event IDs stored in Redis. We also implemented dead letter queues for messages that failed processing after three retries. For monitoring, I set up Prometheus metrics and PagerDuty alerts for consumer lag and error rates. We achieved 99.97% data delivery reliability."),
+    ScriptLine(INTERVIEWER_ID, "That's impressive throughput. How did you handle failures and ensure data consistency in that pipeline?"),
+    ScriptLine(CANDIDATE_ID, "Great question. We implemented several layers of reliability. First, Kafka's built-in replication handled broker failures. For our consumers, I used idempotent processing with deduplication based on event IDs stored in Redis. We also implemented dead letter queues for messages that failed processing after three retries. For monitoring, I set up Prometheus metrics and PagerDuty alerts for consumer lag and error rates. We achieved 99.97% data delivery reliability."),
     
     # Message 7-8: System design
-    (INTERVIEWER_ID, "Nice. Let's shift to system design. If you were tasked with building a real-time collaborative document editor like Google Docs, how would you approach it?"),
-    (CANDIDATE_ID, "I'd start by identifying the core challenges: real-time synchronization, conflict resolution, and scalability. For the sync layer, I'd use WebSockets with a message broker like Redis Pub/Sub for horizontal scaling. The key technical challenge is handling concurrent edits. I'd implement Operational Transformation or CRDTs, probably CRDTs since they're more mathematically sound for eventual consistency. For storage, I'd use a combination of PostgreSQL for document metadata and a specialized data structure for the document content itself. I'd also implement presence awareness so users can see who else is editing."),
+    ScriptLine(INTERVIEWER_ID, "Nice. Let's shift to system design. If you were tasked with building a real-time collaborative document editor like Google Docs, how would you approach it?"),
+    ScriptLine(CANDIDATE_ID, "I'd start by identifying the core challenges: real-time synchronization, conflict resolution, and scalability. For the sync layer, I'd use WebSockets with a message broker like Redis Pub/Sub for horizontal scaling. The key technical challenge is handling concurrent edits. I'd implement Operational Transformation or CRDTs, probably CRDTs since they're more mathematically sound for eventual consistency. For storage, I'd use a combination of PostgreSQL for document metadata and a specialized data structure for the document content itself. I'd also implement presence awareness so users can see who else is editing."),
     
     # Message 9-10: Debugging scenario
-    (INTERVIEWER_ID, "Good approach. Now, imagine you're on call and get paged at 3 AM because the document editor is showing 10 second delays. Walk me through your debugging process."),
-    (CANDIDATE_ID, "First, I'd check our monitoring dashboards to understand the scope. Is it all users or specific regions? Then I'd look at key metrics: WebSocket connection counts, message queue depth, database query latency, and CPU/memory on our servers. If the queue depth is high, we have a consumer bottleneck. If database latency spiked, I'd check for slow queries or locks. I'd also verify recent deployments. Once I identify the bottleneck, I'd either scale horizontally if it's capacity, rollback if it's a bad deploy, or implement a quick mitigation like rate limiting while we fix the root cause. Communication is key too. I'd update the status page and keep stakeholders informed."),
+    ScriptLine(INTERVIEWER_ID, "Good approach. Now, imagine you're on call and get paged at 3 AM because the document editor is showing 10 second delays. Walk me through your debugging process."),
+    ScriptLine(CANDIDATE_ID, "First, I'd check our monitoring dashboards to understand the scope. Is it all users or specific regions? Then I'd look at key metrics: WebSocket connection counts, message queue depth, database query latency, and CPU/memory on our servers. If the queue depth is high, we have a consumer bottleneck. If database latency spiked, I'd check for slow queries or locks. I'd also verify recent deployments. Once I identify the bottleneck, I'd either scale horizontally if it's capacity, rollback if it's a bad deploy, or implement a quick mitigation like rate limiting while we fix the root cause. Communication is key too. I'd update the status page and keep stakeholders informed."),
     
     # Message 11-12: Code quality
-    (INTERVIEWER_ID, "Good systematic approach. How do you ensure code quality in your projects? What's your testing philosophy?"),
-    (CANDIDATE_ID, "I follow the testing pyramid: lots of unit tests, fewer integration tests, and minimal end-to-end tests. For Python, I use pytest religiously. I aim for high coverage on business logic but don't obsess over 100% coverage. I also write property-based tests with Hypothesis for edge case discovery. Beyond testing, I enforce type hints with mypy in strict mode and use ruff for linting. Code reviews are crucial too. I believe every PR should be reviewed, and I try to give thorough, constructive feedback. Documentation is often overlooked but I make sure complex functions have docstrings explaining the why, not just the what."),
+    ScriptLine(INTERVIEWER_ID, "Good systematic approach. How do you ensure code quality in your projects? What's your testing philosophy?"),
+    ScriptLine(CANDIDATE_ID, "I follow the testing pyramid: lots of unit tests, fewer integration tests, and minimal end-to-end tests. For Python, I use pytest religiously. I aim for high coverage on business logic but don't obsess over 100% coverage. I also write property-based tests with Hypothesis for edge case discovery. Beyond testing, I enforce type hints with mypy in strict mode and use ruff for linting. Code reviews are crucial too. I believe every PR should be reviewed, and I try to give thorough, constructive feedback. Documentation is often overlooked but I make sure complex functions have docstrings explaining the why, not just the what."),
     
     # Message 13-14: Team collaboration
-    (INTERVIEWER_ID, "Speaking of code reviews, tell me about a time you disagreed with a colleague on a technical decision. How did you handle it?"),
-    (CANDIDATE_ID, "Last year, we had a heated debate about microservices versus keeping our monolith. My colleague wanted to break everything into services immediately. I was concerned about the operational complexity and believed we should be more surgical. Instead of just arguing, I proposed we create a decision matrix. We listed criteria like deployment complexity, team expertise, latency requirements, and timeline. We scored each approach objectively. The data showed a hybrid approach was best: extract the highest-traffic component first while keeping the rest as a modular monolith. My colleague appreciated the structured approach, and we ended up with a better solution than either of us initially proposed."),
+    ScriptLine(INTERVIEWER_ID, "Speaking of code reviews, tell me about a time you disagreed with a colleague on a technical decision. How did you handle it?"),
+    ScriptLine(CANDIDATE_ID, "Last year, we had a heated debate about microservices versus keeping our monolith. My colleague wanted to break everything into services immediately. I was concerned about the operational complexity and believed we should be more surgical. Instead of just arguing, I proposed we create a decision matrix. We listed criteria like deployment complexity, team expertise, latency requirements, and timeline. We scored each approach objectively. The data showed a hybrid approach was best: extract the highest-traffic component first while keeping the rest as a modular monolith. My colleague appreciated the structured approach, and we ended up with a better solution than either of us initially proposed."),
     
     # Message 15-16: Learning and growth
-    (INTERVIEWER_ID, "That's a mature approach to conflict. How do you stay current with new technologies? The field moves fast."),
-    (CANDIDATE_ID, "I have a few strategies. I dedicate Friday afternoons to learning. Sometimes it's reading papers, sometimes building small prototypes. I follow key people on social media and read their blogs. I also participate in our internal tech talks, both presenting and attending. For deeper learning, I contribute to open source. I maintain a small library for async HTTP caching that has about 500 stars on GitHub. Teaching is learning, so when I learn something new, I try to write about it or present it to the team. Conferences are valuable too. I try to attend one major conference per year, even if just virtually."),
+    ScriptLine(INTERVIEWER_ID, "That's a mature approach to conflict. How do you stay current with new technologies? The field moves fast."),
+    ScriptLine(CANDIDATE_ID, "I have a few strategies. I dedicate Friday afternoons to learning. Sometimes it's reading papers, sometimes building small prototypes. I follow key people on social media and read their blogs. I also participate in our internal tech talks, both presenting and attending. For deeper learning, I contribute to open source. I maintain a small library for async HTTP caching that has about 500 stars on GitHub. Teaching is learning, so when I learn something new, I try to write about it or present it to the team. Conferences are valuable too. I try to attend one major conference per year, even if just virtually."),
     
     # Message 17-18: Specific scenario
-    (INTERVIEWER_ID, "You mentioned async programming. Can you explain a tricky bug you encountered with async code and how you solved it?"),
-    (CANDIDATE_ID, "Oh, I have a good one. We had a memory leak that only appeared under sustained load. After hours of profiling, I discovered we were creating thousands of tasks but never awaiting them. The issue was a fire-and-forget pattern where we'd call create_task but the tasks would accumulate if they completed faster than we checked them. The fix was to use asyncio.TaskGroup, which was new in Python 3.11. It ensures all tasks are properly awaited and handles cancellation correctly. The deeper lesson was that async code requires careful lifecycle management. Now I always use structured concurrency patterns and have a linting rule that flags bare create_task calls."),
+    ScriptLine(INTERVIEWER_ID, "You mentioned async programming. Can you explain a tricky bug you encountered with async code and how you solved it?"),
+    ScriptLine(CANDIDATE_ID, "Oh, I have a good one. We had a memory leak that only appeared under sustained load. After hours of profiling, I discovered we were creating thousands of tasks but never awaiting them. The issue was a fire-and-forget pattern where we'd call create_task but the tasks would accumulate if they completed faster than we checked them. The fix was to use asyncio.TaskGroup, which was new in Python 3.11. It ensures all tasks are properly awaited and handles cancellation correctly. The deeper lesson was that async code requires careful lifecycle management. Now I always use structured concurrency patterns and have a linting rule that flags bare create_task calls."),
     
     # Message 19-20: Closing
-    (INTERVIEWER_ID, "Excellent debugging story. We're coming up on time. Do you have any questions for me about the team or the role?"),
-    (CANDIDATE_ID, "Yes, I have a few. First, what does success look like in this role after six months? Second, how does the team handle technical debt? Is there dedicated time for refactoring, or is it more opportunistic? And finally, I'm curious about the team culture. How do you balance moving fast with maintaining quality?"),
-]
+    ScriptLine(INTERVIEWER_ID, "Excellent debugging story. We're coming up on time. Do you have any questions for me about the team or the role?"),
+    ScriptLine(CANDIDATE_ID, "Yes, I have a few. First, what does success look like in this role after six months? Second, how does the team handle technical debt? Is there dedicated time for refactoring, or is it more opportunistic? And finally, I'm curious about the team culture. How do you balance moving fast with maintaining quality?"),
+)
+
+# Word counts per script message, computed once instead of re-splitting per send
+SCRIPT_WORD_COUNTS: Final[tuple[int, ...]] = tuple(
+    len(line.text.split()) for line in INTERVIEW_SCRIPT
+)
+
+# Audio offset (ms) at which each script message starts: a prefix sum of the
+# spoken duration plus the inter-message pause of every earlier message
+AUDIO_OFFSETS_MS: Final[tuple[float, ...]] = tuple(
+    itertools.accumulate(
+        (
+            word_count * MS_PER_WORD + PAUSE_BETWEEN_MESSAGES_MS
+            for word_count in SCRIPT_WORD_COUNTS[:-1]
+        ),
+        initial=0.0,
+    )
+)
 
 
 # =============================================================================
@@ -124,7 +168,7 @@ class SimulationState(str, Enum):
     ERROR = "error"
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class SentMessage:
     """Record of a sent message"""
     index: int
@@ -144,6 +188,8 @@ def generate_transcript_event(
     text: str,
     event_type: str = "final",
     audio_offset_ms: float = 0.0,
+    word_count: int | None = None,
+    rng: random.Random | None = None,
 ) -> dict[str, object]:
     """
     Generate a v2 transcript event matching C# bot output format.
@@ -153,23 +199,29 @@ def generate_transcript_event(
         text: The transcript text content.
         event_type: Event type, typically "final" for complete transcripts.
         audio_offset_ms: Audio offset from session start in milliseconds.
+        word_count: Precomputed word count of ``text`` (counted if None).
+        rng: Random source for jitter and confidence (module RNG if None).
 
     Returns:
         Dictionary containing the transcript event in v2 format.
     """
-    word_count = len(text.split())
-    duration_ms = word_count * MS_PER_WORD + random.uniform(
-        MIN_DURATION_JITTER_MS, MAX_DURATION_JITTER_MS
+    rand = rng.random if rng is not None else random.random
+    if word_count is None:
+        word_count = len(text.split())
+    duration_ms = (
+        word_count * MS_PER_WORD
+        + MIN_DURATION_JITTER_MS
+        + rand() * DURATION_JITTER_SPAN_MS
     )
 
     return {
         "event_type": event_type,
         "text": text,
-        "timestamp_utc": datetime.now(timezone.utc).isoformat().replace("+00:00", "Z"),
+        "timestamp_utc": utc_now_iso(),
         "speaker_id": speaker_id,
         "audio_start_ms": round(audio_offset_ms, 1),
         "audio_end_ms": round(audio_offset_ms + duration_ms, 1),
-        "confidence": round(random.uniform(MIN_CONFIDENCE, MAX_CONFIDENCE), 3),
+        "confidence": round(MIN_CONFIDENCE + rand() * CONFIDENCE_SPAN, 3),
         "metadata": {
             "provider": "deepgram",
             "model": "nova-3",
@@ -190,7 +242,7 @@ def generate_session_event(event_type: str) -> dict[str, object]:
     return {
         "event_type": event_type,
         "text": None,
-        "timestamp_utc": datetime.now(timezone.utc).isoformat().replace("+00:00", "Z"),
+        "timestamp_utc": utc_now_iso(),
         "speaker_id": None,
         "metadata": {
             "provider": "deepgram",
@@ -198,7 +250,11 @@ def generate_session_event(event_type: str) -> dict[str, object]:
     }
 
 
-def calculate_delay(speaker_id: str, text: str) -> float:
+def calculate_delay(
+    speaker_id: str,
+    text: str,
+    rng: random.Random | None = None,
+) -> float:
     """
     Calculate realistic delay based on speaker and message length.
 
@@ -208,12 +264,14 @@ def calculate_delay(speaker_id: str, text: str) -> float:
     Args:
         speaker_id: The speaker identifier.
         text: The message text (used for length-based delay calculation).
+        rng: Random source for jitter (module RNG if None).
 
     Returns:
         Delay in seconds before the next message.
     """
+    rand = rng.random if rng is not None else random.random
     if speaker_id == INTERVIEWER_ID:
-        return random.uniform(INTERVIEWER_DELAY_MIN, INTERVIEWER_DELAY_MAX)
+        return INTERVIEWER_DELAY_MIN + rand() * INTERVIEWER_DELAY_SPAN
 
     # Candidate delay scales with message length
     word_count = len(text.split())
@@ -221,11 +279,27 @@ def calculate_delay(speaker_id: str, text: str) -> float:
 
     # Clamp to reasonable range with some randomness
     delay = max(CANDIDATE_DELAY_MIN, min(CANDIDATE_DELAY_MAX, base_delay))
-    delay += random.uniform(-DELAY_JITTER_RANGE, DELAY_JITTER_RANGE)
+    delay += (2.0 * rand() - 1.0) * DELAY_JITTER_RANGE
 
     return max(CANDIDATE_DELAY_MIN, min(CANDIDATE_DELAY_MAX, delay))
 
 
+def build_delay_schedule(rng: random.Random) -> tuple[float, ...]:
+    """
+    Precompute the post-message delay for every script entry.
+
+    Args:
+        rng: Seeded random source, so the same seed replays the same pacing.
+
+    Returns:
+        Delay in seconds after each INTERVIEW_SCRIPT message, by index.
+    """
+    return tuple(
+        calculate_delay(speaker_id, text, rng)
+        for speaker_id, text in INTERVIEW_SCRIPT
+    )
+
+
 # =============================================================================
 # Simulation Engine
 # =============================================================================
@@ -256,6 +330,7 @@ class SimulationEngine:
         sink_url: str = SINK_URL,
         candidate_name: str = CANDIDATE_NAME,
         meeting_url: str = MEETING_URL,
+        seed: int = DEFAULT_SIMULATION_SEED,
     ) -> None:
         """
         Initialize the simulation engine.
@@ -264,25 +339,34 @@ class SimulationEngine:
             sink_url: URL of the transcript sink service.
             candidate_name: Name of the interview candidate.
             meeting_url: URL of the Teams meeting.
+            seed: Seed for pacing, jitter, and confidence; each fresh run
+                replays the same values.
         """
         self.sink_url: str = sink_url
         self.candidate_name: str = candidate_name
         self.meeting_url: str = meeting_url
+        self.seed: int = seed
 
         # State
         self._state: SimulationState = SimulationState.IDLE
         self._current_index: int = 0
         self._messages_sent: list[SentMessage] = []
-        self._audio_offset_ms: float = 0.0
         self._session_id: str | None = None
         self._error: str | None = None
 
+        # Replayable randomness, reseeded on every fresh start
+        self._rng: random.Random = random.Random(seed)
+        self._delay_schedule: tuple[float, ...] = build_delay_schedule(self._rng)
+
         # Threading
         self._lock: threading.Lock = threading.Lock()
         self._stop_event: asyncio.Event = asyncio.Event()
         self._running_task: asyncio.Task[None] | None = None
         self._finalize_task: asyncio.Task[None] | None = None  # Track finalization task
 
+        # Shared client for the lifetime of one run loop (keep-alive reuse)
+        self._client: httpx.AsyncClient | None = None
+
         logger.info(
             "SimulationEngine initialized: sink=%s, candidate=%s",
             sink_url,
@@ -368,9 +452,9 @@ class SimulationEngine:
                 # Start fresh
                 self._current_index = 0
                 self._messages_sent = []
-                self._audio_offset_ms = 0.0
                 self._session_id = None
                 self._error = None
+                self._reseed()
             
             # Resume from paused or start fresh
             self._state = SimulationState.RUNNING
@@ -439,10 +523,10 @@ class SimulationEngine:
             self._state = SimulationState.IDLE
             self._current_index = 0
             self._messages_sent = []
-            self._audio_offset_ms = 0.0
             self._session_id = None
             self._error = None
             self._finalize_task = None
+            self._reseed()
 
         logger.info("Simulation reset to beginning")
 
@@ -469,24 +553,26 @@ class SimulationEngine:
 
             index = self._current_index
             speaker_id, text = INTERVIEW_SCRIPT[index]
-            audio_offset = self._audio_offset_ms
+            word_count = SCRIPT_WORD_COUNTS[index]
+            audio_offset = AUDIO_OFFSETS_MS[index]
 
         # Generate and send event
         event = generate_transcript_event(
             speaker_id=speaker_id,
             text=text,
             audio_offset_ms=audio_offset,
+            word_count=word_count,
+            rng=self._rng,
         )
 
         try:
-            async with httpx.AsyncClient(timeout=10.0) as client:
-                resp = await client.post(f"{self.sink_url}/transcript", json=event)
-                if resp.status_code != 200:
-                    logger.warning(
-                        "Failed to send transcript: %d - %s",
-                        resp.status_code,
-                        resp.text,
-                    )
+            resp = await self._post("/transcript", event)
+            if resp.status_code != 200:
+                logger.warning(
+                    "Failed to send transcript: %d - %s",
+                    resp.status_code,
+                    resp.text,
+                )
         except httpx.ConnectError as e:
             logger.error("Connection error sending transcript: %s", e)
             with self._lock:
@@ -501,7 +587,6 @@ class SimulationEngine:
             return None
 
         # Record sent message
-        word_count = len(text.split())
         sent_msg = SentMessage(
             index=index,
             speaker_id=speaker_id,
@@ -514,7 +599,6 @@ class SimulationEngine:
         with self._lock:
             self._messages_sent.append(sent_msg)
             self._current_index += 1
-            self._audio_offset_ms += word_count * 60 + 500  # Add 500ms pause between messages
         
         role = "Interviewer" if speaker_id == INTERVIEWER_ID else "Candidate"
         logger.info(f"[{index + 1}/{len(INTERVIEW_SCRIPT)}] {role}: {text[:80]}...")
@@ -525,6 +609,30 @@ class SimulationEngine:
     # Internal Methods
     # -------------------------------------------------------------------------
 
+    async def _get(self, path: str) -> httpx.Response:
+        """GET from the sink on the run's pooled client (or a one-off client)."""
+        if self._client is not None:
+            return await self._client.get(f"{self.sink_url}{path}")
+        async with httpx.AsyncClient(timeout=HTTP_TIMEOUT_SECONDS) as client:
+            return await client.get(f"{self.sink_url}{path}")
+
+    async def _post(self, path: str, payload: dict[str, object]) -> httpx.Response:
+        """POST JSON to the sink on the run's pooled client (or a one-off client)."""
+        body = to_json(payload)
+        if self._client is not None:
+            return await self._client.post(
+                f"{self.sink_url}{path}", content=body, headers=JSON_HEADERS
+            )
+        async with httpx.AsyncClient(timeout=HTTP_TIMEOUT_SECONDS) as client:
+            return await client.post(
+                f"{self.sink_url}{path}", content=body, headers=JSON_HEADERS
+            )
+
+    def _reseed(self) -> None:
+        """Reset the RNG and delay schedule so a fresh run replays identically."""
+        self._rng = random.Random(self.seed)
+        self._delay_schedule = build_delay_schedule(self._rng)
+
     async def _run_loop(self) -> None:
         """
         Main simulation loop with timing and pause support.
@@ -533,43 +641,15 @@ class SimulationEngine:
         Uses interruptible waits to support pause/resume functionality.
         """
         try:
-            # Initialize session if starting fresh
-            if self._current_index == 0:
-                await self._initialize_session()
-
-            while True:
-                # Check for stop signal
-                if self._stop_event.is_set():
-                    logger.info("Stop signal received")
-                    break
-
-                # Check if complete
-                with self._lock:
-                    if self._current_index >= len(INTERVIEW_SCRIPT):
-                        self._state = SimulationState.COMPLETED
-                        break
-
-                    speaker_id, text = INTERVIEW_SCRIPT[self._current_index]
-
-                # Execute step
-                event = await self.run_step()
-                if event is None:
-                    break
-
-                # Calculate and apply delay
-                delay = calculate_delay(speaker_id, text)
-
-                # Wait with interruptible sleep
+            async with httpx.AsyncClient(
+                timeout=HTTP_TIMEOUT_SECONDS,
+                limits=HTTP_LIMITS,
+            ) as client:
+                self._client = client
                 try:
-                    await asyncio.wait_for(
-                        self._stop_event.wait(),
-                        timeout=delay,
-                    )
-                    # Stop event was set
-                    break
-                except asyncio.TimeoutError:
-                    # Normal timeout, continue to next message
-                    pass
+                    await self._play_script()
+                finally:
+                    self._client = None
 
             # Finalize session if completed - properly track the task
             # NOTE: Previously this was a bare create_task() which leaked tasks.
@@ -597,6 +677,52 @@ class SimulationEngine:
                 self._state = SimulationState.ERROR
                 self._error = str(e)
     
+    async def _play_script(self) -> None:
+        """
+        Send script messages with pacing until stopped or complete.
+
+        Initializes the sink session first when starting from index 0.
+        """
+        # Initialize session if starting fresh
+        if self._current_index == 0:
+            await self._initialize_session()
+
+        # Pace against a monotonic deadline so the time spent posting each
+        # message does not stretch the schedule.
+        loop = asyncio.get_running_loop()
+        next_at = loop.time()
+        while True:
+            # Check for stop signal
+            if self._stop_event.is_set():
+                logger.info("Stop signal received")
+                break
+
+            # Check if complete
+            with self._lock:
+                if self._current_index >= len(INTERVIEW_SCRIPT):
+                    self._state = SimulationState.COMPLETED
+                    break
+
+                delay = self._delay_schedule[self._current_index]
+
+            # Execute step
+            event = await self.run_step()
+            if event is None:
+                break
+
+            # Wait with interruptible sleep
+            next_at += delay
+            try:
+                await asyncio.wait_for(
+                    self._stop_event.wait(),
+                    timeout=max(0.0, next_at - loop.time()),
+                )
+                # Stop event was set
+                break
+            except asyncio.TimeoutError:
+                # Normal timeout, continue to next message
+                pass
+    
     async def _initialize_session(self) -> None:
         """
         Initialize session with transcript sink.
@@ -607,47 +733,34 @@ class SimulationEngine:
         """
         logger.info("Initializing session for: %s", self.candidate_name)
 
-        async with httpx.AsyncClient(timeout=10.0) as client:
-            # Check sink health
-            resp = await client.get(f"{self.sink_url}/health")
-            if resp.status_code != 200:
-                raise RuntimeError(f"Sink not healthy: {resp.status_code}")
-            logger.info("Sink healthy: %s", resp.json())
-
-            # Start session
-            resp = await client.post(
-                f"{self.sink_url}/session/start",
-                json={
-                    "candidate_name": self.candidate_name,
-                    "meeting_url": self.meeting_url,
-                },
-            )
-            if resp.status_code != 200:
-                raise RuntimeError(f"Failed to start session: {resp.text}")
-
-            session_data: dict[str, object] = resp.json()
-            with self._lock:
-                self._session_id = str(session_data.get("session_id", ""))
-
-            logger.info("Session started: %s", self._session_id)
+        # Check sink health
+        resp = await self._get("/health")
+        if resp.status_code != 200:
+            raise RuntimeError(f"Sink not healthy: {resp.status_code}")
+        logger.info("Sink healthy: %s", resp.json())
+
+        # Start session, map speakers, and send session_started in one request
+        resp = await self._post(
+            "/session/bootstrap",
+            {
+                "candidate_name": self.candidate_name,
+                "meeting_url": self.meeting_url,
+                "speakers": [
+                    {"speaker_id": INTERVIEWER_ID, "role": "interviewer"},
+                    {"speaker_id": CANDIDATE_ID, "role": "candidate"},
+                ],
+                "events": [generate_session_event("session_started")],
+            },
+        )
+        if resp.status_code != 200:
+            raise RuntimeError(f"Failed to start session: {resp.text}")
 
-            # Map speakers
-            await client.post(
-                f"{self.sink_url}/session/map-speaker",
-                json={"speaker_id": INTERVIEWER_ID, "role": "interviewer"},
-            )
-            await client.post(
-                f"{self.sink_url}/session/map-speaker",
-                json={"speaker_id": CANDIDATE_ID, "role": "candidate"},
-            )
-            logger.info("Speakers mapped: speaker_0=interviewer, speaker_1=candidate")
+        session_data: dict[str, object] = resp.json()
+        with self._lock:
+            self._session_id = str(session_data.get("session_id", ""))
 
-            # Send session started event
-            await client.post(
-                f"{self.sink_url}/transcript",
-                json=generate_session_event("session_started"),
-            )
-            logger.info("Session started event sent")
+        logger.info("Session started: %s", self._session_id)
+        logger.info("Speakers mapped: %s", session_data.get("speaker_mappings"))
     
     async def _finalize_session(self) -> None:
         """
@@ -659,11 +772,12 @@ class SimulationEngine:
         logger.info("Finalizing session...")
 
         try:
-            async with httpx.AsyncClient(timeout=10.0) as client:
+            async with httpx.AsyncClient(timeout=HTTP_TIMEOUT_SECONDS) as client:
                 # Send session stopped event
                 await client.post(
                     f"{self.sink_url}/transcript",
-                    json=generate_session_event("session_stopped"),
+                    content=to_json(generate_session_event("session_stopped")),
+                    headers=JSON_HEADERS,
                 )
 
                 await asyncio.sleep(0.5)
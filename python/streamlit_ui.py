@@ -9,7 +9,9 @@ Two-column workspace:
   - Right 40%: notebook panel (running summary, running notes, topics)
     plus session controls.
 
-Polls /session/status every 0.5s; /session/analysis on a slower cadence.
+Polls /session/status every 0.5s. /session/analysis is re-read on a background
+thread whenever the sink's /session/events stream reports a new item, so the
+notebook panel only drains queued updates.
 Compose box posts into the meeting chat on behalf of a human user.
 
 Usage:
@@ -19,18 +21,26 @@ Usage:
 
 from __future__ import annotations
 
+import itertools
 import logging
 import os
+import queue
+import threading
 import time
 import uuid
-from datetime import datetime, timezone
+from collections import deque
 from pathlib import Path
-from typing import Any, Final
+from typing import Any, Final, Iterator
 
 import httpx
 import streamlit as st
+from pydantic import BaseModel, Field, ValidationError
+from pydantic_core import from_json, to_json
+
+from streamlit.runtime.scriptrunner import add_script_run_ctx
 
 from batcave_platform import load_product_spec
+from meeting_agent.models import utc_now_iso
 
 logger: logging.Logger = logging.getLogger(__name__)
 
@@ -43,8 +53,25 @@ INSTANCE_ID: Final[str] = os.environ.get("INSTANCE_ID", PRODUCT_SPEC.product_id)
 SINK_URL: Final[str] = os.environ.get("SINK_URL", "http://127.0.0.1:8765")
 
 HTTP_TIMEOUT: Final[float] = 5.0
+HTTP_LIMITS: Final[httpx.Limits] = httpx.Limits(max_keepalive_connections=4)
+# Request bodies are pre-encoded with pydantic-core's serializer
+JSON_HEADERS: Final[dict[str, str]] = {"content-type": "application/json"}
 STATUS_POLL_SECONDS: Final[float] = 0.5
+STATUS_CACHE_TTL_SECONDS: Final[float] = 0.5
 ANALYSIS_POLL_SECONDS: Final[float] = 2.0
+ANALYSIS_WORKER_IDLE_SECONDS: Final[float] = 60.0
+# The sink sends a keep-alive comment every 15s, so a 30s read timeout only
+# fires on a dead stream.
+EVENT_STREAM_TIMEOUT: Final[httpx.Timeout] = httpx.Timeout(HTTP_TIMEOUT, read=30.0)
+ANALYSIS_WAKE_EVENTS: Final[frozenset[str]] = frozenset(
+    {"analysis_item", "session_started", "session_ended"}
+)
+# Events that change what /session/status returns for the timeline
+TIMELINE_EVENTS: Final[frozenset[str]] = frozenset(
+    {"ledger_append", "session_state", "session_started", "session_ended"}
+)
+# Refetch status at least this often even without events (e.g. checklist updates)
+STATUS_MAX_AGE_SECONDS: Final[float] = 5.0
 
 ROLE_BADGES: Final[dict[str, str]] = {
     "bot": "🤖 Alfred",
@@ -54,24 +81,39 @@ ROLE_BADGES: Final[dict[str, str]] = {
     "unknown": "❓",
 }
 
+TIMELINE_WINDOW: Final[int] = 80
+NOTES_VISIBLE: Final[int] = 30
+TIMELINE_WINDOW_STEP: Final[int] = 80
+TIMELINE_CARD_CACHE_SIZE: Final[int] = 512
+
 KIND_ICON: Final[dict[str, str]] = {
     "speech": "🎙️",
     "chat": "💬",
 }
 
-# =============================================================================
-# Page shell
-# =============================================================================
+# (is_chat, from_bot) -> timeline card CSS classes
+CARD_CLASSES: Final[dict[tuple[bool, bool], str]] = {
+    (False, False): "alfred-card",
+    (True, False): "alfred-card chat",
+    (False, True): "alfred-card bot",
+    (True, True): "alfred-card chat bot",
+}
 
-st.set_page_config(
-    page_title=PRODUCT_SPEC.ui.page_title,
-    page_icon=PRODUCT_SPEC.ui.page_icon,
-    layout="wide",
-    initial_sidebar_state="collapsed",
-)
+# Header badge CSS class -> label
+STATUS_BADGE_TEXT: Final[dict[str, str]] = {
+    "listening": "LISTENING",
+    "muted": "MUTED",
+    "inactive": "IDLE",
+}
 
-st.markdown(
-    """
+CHECKLIST_MARKS: Final[dict[str, str]] = {
+    "complete": "✅",
+    "analyzing": "🟡",
+    "pending": "⬜",
+}
+DEFAULT_CHECKLIST_MARK: Final[str] = CHECKLIST_MARKS["pending"]
+
+PAGE_CSS: Final[str] = """
     <style>
     #MainMenu, footer, .stDeployButton { visibility: hidden; }
     .block-container { padding-top: 1rem; padding-bottom: 1rem; max-width: 1600px; }
@@ -96,10 +138,58 @@ st.markdown(
     .alfred-status.inactive  { background: #E2E8F0; color: #475569; }
     .alfred-card.bot .meta { color: #92400E; }
     </style>
-    """,
-    unsafe_allow_html=True,
+    """
+
+# =============================================================================
+# Page shell
+# =============================================================================
+
+st.set_page_config(
+    page_title=PRODUCT_SPEC.ui.page_title,
+    page_icon=PRODUCT_SPEC.ui.page_icon,
+    layout="wide",
+    initial_sidebar_state="collapsed",
 )
 
+# Sent on every full rerun on purpose: Streamlit drops elements a run does not
+# re-emit, so a send-once guard would unstyle the page after the first rerun.
+# The polling fragments rerun only their own bodies and never resend this.
+st.markdown(PAGE_CSS, unsafe_allow_html=True)
+
+# =============================================================================
+# Analysis payload
+# =============================================================================
+
+
+class ExtractionView(BaseModel):
+    """The slice of an item's Alfred extraction the notebook reads."""
+
+    notes: list[str] = Field(default_factory=list)
+
+
+class AnalysisItemView(BaseModel):
+    """The slice of an analysis item the notebook reads."""
+
+    extraction: ExtractionView | None = None
+    key_points: list[str] = Field(default_factory=list)
+
+
+class AnalysisBodyView(BaseModel):
+    """The slice of a session analysis the notebook reads."""
+
+    running_summary: str = ""
+    topics: list[str] = Field(default_factory=list)
+    analysis_items: list[AnalysisItemView] = Field(default_factory=list)
+
+
+class AnalysisPollView(BaseModel):
+    """Typed ``/session/analysis`` response, decoded straight from the body bytes."""
+
+    session_id: str | None = None
+    total_items: int = 0
+    analysis: AnalysisBodyView | None = None
+
+
 # =============================================================================
 # Session state
 # =============================================================================
@@ -108,7 +198,16 @@ st.markdown(
 def _init_state() -> None:
     st.session_state.setdefault("alfred_muted", False)
     st.session_state.setdefault("last_status", None)
+    st.session_state.setdefault("status_seq", -1)
+    st.session_state.setdefault("status_fetched_at", 0.0)
     st.session_state.setdefault("last_analysis", None)
+    st.session_state.setdefault("analysis_session_id", None)
+    st.session_state.setdefault("analysis_worker", None)
+    st.session_state.setdefault("timeline_window", TIMELINE_WINDOW)
+    st.session_state.setdefault("timeline_cards", {})
+    st.session_state.setdefault("timeline_html", (None, ""))
+    st.session_state.setdefault("alfred_notes", deque(maxlen=NOTES_VISIBLE))
+    st.session_state.setdefault("alfred_notes_seen", set())
     st.session_state.setdefault("compose_draft", "")
     st.session_state.setdefault("candidate_name", "")
     st.session_state.setdefault(
@@ -124,24 +223,36 @@ _init_state()
 # =============================================================================
 
 
-def _sink_get(path: str, timeout: float = HTTP_TIMEOUT) -> dict[str, Any] | None:
+@st.cache_resource(show_spinner=False)
+def get_http_client() -> httpx.Client:
+    """One pooled keep-alive client per process, shared across reruns and sessions."""
+    return httpx.Client(base_url=SINK_URL, timeout=HTTP_TIMEOUT, limits=HTTP_LIMITS)
+
+
+def _sink_get_response(path: str, timeout: float = HTTP_TIMEOUT) -> httpx.Response | None:
     try:
-        with httpx.Client(timeout=timeout) as client:
-            resp = client.get(f"{SINK_URL}{path}")
+        resp = get_http_client().get(path, timeout=timeout)
         if resp.status_code == 200:
-            return resp.json()
+            return resp
         logger.warning("GET %s -> %s", path, resp.status_code)
     except httpx.HTTPError as exc:
         logger.debug("GET %s failed: %s", path, exc)
     return None
 
 
+def _sink_get(path: str, timeout: float = HTTP_TIMEOUT) -> dict[str, Any] | None:
+    resp = _sink_get_response(path, timeout)
+    return from_json(resp.content) if resp is not None else None
+
+
 def _sink_post(path: str, body: dict[str, Any]) -> tuple[int, dict[str, Any] | None]:
     try:
-        with httpx.Client(timeout=HTTP_TIMEOUT) as client:
-            resp = client.post(f"{SINK_URL}{path}", json=body)
+        resp = get_http_client().post(path, content=to_json(body), headers=JSON_HEADERS)
+        # Any write can change the session, so the next status read goes to the sink.
+        fetch_status.clear()
+        st.session_state.last_status = None
         try:
-            return resp.status_code, resp.json()
+            return resp.status_code, from_json(resp.content)
         except ValueError:
             return resp.status_code, None
     except httpx.HTTPError as exc:
@@ -149,12 +260,152 @@ def _sink_post(path: str, body: dict[str, Any]) -> tuple[int, dict[str, Any] | N
         return 0, None
 
 
+@st.cache_data(ttl=STATUS_CACHE_TTL_SECONDS, show_spinner=False)
 def fetch_status() -> dict[str, Any] | None:
+    """Session status, shared by every rerun and browser tab within the TTL."""
     return _sink_get("/session/status")
 
 
-def fetch_analysis() -> dict[str, Any] | None:
-    return _sink_get("/session/analysis")
+def fetch_analysis(since: int = 0) -> AnalysisPollView | None:
+    resp = _sink_get_response(f"/session/analysis?since={since}")
+    if resp is None:
+        return None
+    try:
+        return AnalysisPollView.model_validate_json(resp.content)
+    except ValidationError as exc:
+        logger.warning("GET /session/analysis returned an unexpected body: %s", exc)
+        return None
+
+
+class AnalysisWorker:
+    """
+    Reads ``/session/analysis`` on a daemon thread and queues each response.
+
+    The worker follows the sink's ``/session/events`` SSE stream and only
+    re-reads the analysis when an ``ANALYSIS_WAKE_EVENTS`` event arrives, so
+    an idle meeting costs no requests and new items show up without waiting
+    out a poll interval. If the stream is unavailable it polls every
+    ``ANALYSIS_POLL_SECONDS`` until it can reconnect.
+
+    The same stream counts ``TIMELINE_EVENTS`` in ``timeline_seq`` so the
+    timeline fragment can skip status fetches while nothing has changed.
+
+    The worker owns the ``since`` cursor, so the notebook fragment never
+    blocks on HTTP: it publishes the session id it last saw in status as a
+    hint and drains whatever the worker has queued. The thread exits on its
+    own once nobody has drained it for ``ANALYSIS_WORKER_IDLE_SECONDS``
+    (e.g. the browser tab closed).
+    """
+
+    def __init__(self) -> None:
+        self.updates: queue.SimpleQueue[AnalysisPollView] = queue.SimpleQueue()
+        # Session id from the latest status poll: None means no session, so
+        # skip the request; ``status_known`` False means fall back to the
+        # session id the sink reports.
+        self.session_hint: str | None = None
+        self.status_known = False
+        self.stream_connected = False
+        self.timeline_seq = 0
+        self._session_id: str | None = None
+        self._cursor = 0
+        self._last_drained = time.monotonic()
+        self._stop = threading.Event()
+        self._thread = threading.Thread(
+            target=self._run, name="alfred-analysis-poll", daemon=True
+        )
+        add_script_run_ctx(self._thread)
+        self._thread.start()
+
+    @property
+    def is_alive(self) -> bool:
+        return self._thread.is_alive()
+
+    def stop(self) -> None:
+        self._stop.set()
+
+    def drain(self) -> list[AnalysisPollView]:
+        """Return every queued response, oldest first, without blocking."""
+        self._last_drained = time.monotonic()
+        drained: list[AnalysisPollView] = []
+        while True:
+            try:
+                drained.append(self.updates.get_nowait())
+            except queue.Empty:
+                return drained
+
+    def _should_exit(self) -> bool:
+        if self._stop.is_set():
+            return True
+        if time.monotonic() - self._last_drained > ANALYSIS_WORKER_IDLE_SECONDS:
+            logger.debug("Analysis worker idle; stopping")
+            return True
+        return False
+
+    def _run(self) -> None:
+        while not self._should_exit():
+            try:
+                self._follow_events()
+            except httpx.HTTPError as exc:
+                logger.debug("Event stream unavailable (%s); polling instead", exc)
+            if self._should_exit():
+                return
+            self._safe_poll()
+            self._stop.wait(ANALYSIS_POLL_SECONDS)
+
+    def _follow_events(self) -> None:
+        with get_http_client().stream(
+            "GET", "/session/events", timeout=EVENT_STREAM_TIMEOUT
+        ) as resp:
+            resp.raise_for_status()
+            self.stream_connected = True
+            try:
+                # Catch up on anything written before the subscription started.
+                self.timeline_seq += 1
+                self._safe_poll()
+                for line in resp.iter_lines():
+                    if self._should_exit():
+                        return
+                    if not line.startswith("event: "):
+                        continue
+                    event_type = line[7:]
+                    if event_type in TIMELINE_EVENTS:
+                        self.timeline_seq += 1
+                    if event_type in ANALYSIS_WAKE_EVENTS:
+                        self._safe_poll()
+            finally:
+                self.stream_connected = False
+
+    def _safe_poll(self) -> None:
+        try:
+            self._poll_once()
+        except Exception:
+            logger.exception("Analysis poll failed")
+
+    def _poll_once(self) -> None:
+        if self.status_known:
+            hint = self.session_hint
+            if not hint:
+                return
+            if hint != self._session_id:
+                self._session_id = hint
+                self._cursor = 0
+
+        analysis = fetch_analysis(self._cursor)
+        if analysis is None:
+            return
+
+        if analysis.session_id != self._session_id:
+            # Status was unavailable or stale: re-read the new session from the start.
+            had_cursor = bool(self._cursor)
+            self._session_id = analysis.session_id
+            self._cursor = 0
+            if had_cursor:
+                analysis = fetch_analysis(0)
+                if analysis is None:
+                    return
+
+        self._cursor = analysis.total_items
+        self.updates.put(analysis)
 
 
 def start_session(candidate_name: str, meeting_url: str) -> tuple[int, dict[str, Any] | None]:
@@ -172,9 +423,24 @@ def end_session() -> tuple[int, dict[str, Any] | None]:
     return _sink_post("/session/end", {})
 
 
+@st.cache_resource(show_spinner=False)
+def _message_id_source() -> tuple[str, Iterator[int]]:
+    """Process-wide (random prefix, counter) for chat message ids.
+
+    Cached so the counter survives script reruns; the prefix keeps ids unique
+    across UI restarts, since the sink drops repeated message ids.
+    """
+    return uuid.uuid4().hex[:6], itertools.count(1)
+
+
+def _next_message_id() -> str:
+    prefix, counter = _message_id_source()
+    return f"ui_{prefix}_{next(counter)}"
+
+
 def post_chat(text: str, as_alfred: bool) -> tuple[int, dict[str, Any] | None]:
-    now = datetime.now(timezone.utc).isoformat().replace("+00:00", "Z")
-    msg_id = f"ui_{uuid.uuid4().hex[:10]}"
+    now = utc_now_iso()
+    msg_id = _next_message_id()
     return _sink_post(
         "/chat",
         {
@@ -196,9 +462,7 @@ def post_simulated_speech(speaker_id: str, text: str) -> tuple[int, dict[str, An
         {
             "event_type": "final",
             "text": text,
-            "timestamp_utc": datetime.now(timezone.utc)
-            .isoformat()
-            .replace("+00:00", "Z"),
+            "timestamp_utc": utc_now_iso(),
             "speaker_id": speaker_id,
             "confidence": 0.95,
         },
@@ -214,8 +478,8 @@ def render_header(status: dict[str, Any] | None) -> None:
     session = (status or {}).get("session") or {}
     active = bool(session.get("active"))
     muted = bool(st.session_state.get("alfred_muted"))
-    badge_class = "listening" if active and not muted else ("muted" if muted else "inactive")
-    badge_text = "LISTENING" if active and not muted else ("MUTED" if muted else "IDLE")
+    badge_class = "muted" if muted else ("listening" if active else "inactive")
+    badge_text = STATUS_BADGE_TEXT[badge_class]
 
     cols = st.columns([6, 2, 1])
     with cols[0]:
@@ -240,6 +504,33 @@ def render_header(status: dict[str, Any] | None) -> None:
                 st.rerun()
 
 
+def _timeline_card_html(
+    kind: str,
+    role: str,
+    display_name: str,
+    clock: str,
+    from_bot: bool,
+    text: str,
+) -> str:
+    """Build the markup for one timeline card."""
+    css_class = CARD_CLASSES[kind == "chat", from_bot]
+    icon = KIND_ICON.get(kind, "•")
+    badge = ROLE_BADGES.get(role, role)
+    meta = f"{icon} {badge} · {display_name} · {clock}"
+    safe_text = (
+        text.replace("&", "&amp;")
+        .replace("<", "&lt;")
+        .replace(">", "&gt;")
+        .replace("\n", "<br>")
+    )
+    return (
+        f"<div class='{css_class}'>"
+        f"<div class='meta'>{meta}</div>"
+        f"<div class='text'>{safe_text}</div>"
+        f"</div>"
+    )
+
+
 def render_timeline(status: dict[str, Any] | None) -> None:
     session = (status or {}).get("session") or {}
     history = session.get("meeting_history") or []
@@ -249,7 +540,34 @@ def render_timeline(status: dict[str, Any] | None) -> None:
         st.info("No activity yet. Start a session and speak or chat in the meeting.")
         return
 
-    for entry in history[-80:]:
+    window: int = st.session_state.timeline_window
+    hidden = len(history) - window
+    if hidden > 0:
+        step = min(TIMELINE_WINDOW_STEP, hidden)
+        if st.button(f"⬆ Load {step} earlier ({hidden} hidden)", key="timeline_load_earlier"):
+            window += step
+            st.session_state.timeline_window = window
+
+    # Polls that change nothing reuse the previous markup. Speech merges only
+    # ever rewrite the newest entry, so it stands in for the whole history.
+    last = history[-1]
+    signature = (window, len(history), last.get("timestamp_utc"), last.get("text"))
+    rendered_for, html = st.session_state.timeline_html
+    if rendered_for == signature:
+        st.markdown(html, unsafe_allow_html=True)
+        return
+
+    # Card markup is memoized per browser session across polls and full
+    # reruns; a merged speech entry gets new text and so a new key.
+    card_cache: dict[tuple[str, str, str, str, bool, str], str] = (
+        st.session_state.timeline_cards
+    )
+    if len(card_cache) > TIMELINE_CARD_CACHE_SIZE:
+        card_cache.clear()
+
+    # Only the newest ``window`` entries are built and sent to the browser.
+    cards: list[str] = []
+    for entry in history[-window:]:
         kind = entry.get("kind") or "speech"
         role = entry.get("role") or "unknown"
         text = (entry.get("text") or "").strip()
@@ -262,95 +580,136 @@ def render_timeline(status: dict[str, Any] | None) -> None:
         )
         ts = entry.get("timestamp_utc") or ""
         clock = ts[11:19] if len(ts) >= 19 else ts
-        from_bot = bool(entry.get("from_bot"))
-
-        css_class = "alfred-card"
-        if kind == "chat":
-            css_class += " chat"
-        if from_bot:
-            css_class += " bot"
-
-        icon = KIND_ICON.get(kind, "•")
-        badge = ROLE_BADGES.get(role, role)
-        meta = f"{icon} {badge} · {display_name} · {clock}"
-        safe_text = (
-            text.replace("&", "&amp;")
-            .replace("<", "&lt;")
-            .replace(">", "&gt;")
-            .replace("\n", "<br>")
-        )
-        st.markdown(
-            f"<div class='{css_class}'>"
-            f"<div class='meta'>{meta}</div>"
-            f"<div class='text'>{safe_text}</div>"
-            f"</div>",
-            unsafe_allow_html=True,
-        )
+        key = (kind, role, str(display_name), clock, bool(entry.get("from_bot")), text)
+        card = card_cache.get(key)
+        if card is None:
+            card = card_cache[key] = _timeline_card_html(*key)
+        cards.append(card)
+
+    # One markdown element for the whole timeline instead of one per entry.
+    html = "".join(cards)
+    st.session_state.timeline_html = (signature, html)
+    st.markdown(html, unsafe_allow_html=True)
 
 
-def _collect_alfred_notes(analysis: dict[str, Any] | None) -> tuple[str, list[str], list[str]]:
-    """Extract (running_summary, notes, topics) from the session analysis payload."""
-    if not analysis:
+def _collect_alfred_notes(
+    analysis: AnalysisPollView | None,
+    seen: set[str],
+) -> tuple[str, list[str], list[str]]:
+    """Extract (running_summary, new notes, topics) from a session analysis payload.
+
+    Notes already in ``seen`` are skipped; ``seen`` is updated in place.
+    """
+    body = analysis.analysis if analysis is not None else None
+    if body is None:
         return "", [], []
-    body = (analysis or {}).get("analysis") or {}
-    running_summary = body.get("running_summary") or ""
-    topics = list(body.get("topics") or [])
 
     notes: list[str] = []
-    for item in body.get("analysis_items") or []:
-        action = (item or {}).get("alfred_action") or {}
-        for note in action.get("notes") or []:
-            if note and note not in notes:
+    for item in body.analysis_items:
+        # Fall back to legacy key_points when the extraction isn't populated yet.
+        source = item.extraction.notes if item.extraction is not None else item.key_points
+        for note in source:
+            if note and note not in seen:
+                seen.add(note)
                 notes.append(note)
-        # Fall back to legacy key_points when alfred_action isn't populated yet.
-        if not action:
-            for kp in (item or {}).get("key_points") or []:
-                if kp and kp not in notes:
-                    notes.append(kp)
 
-    return running_summary, notes, topics
+    return body.running_summary, notes, list(body.topics)
+
+
+def _reset_analysis_state(state: Any, session_id: str | None) -> None:
+    state.analysis_session_id = session_id
+    state.alfred_notes = deque(maxlen=NOTES_VISIBLE)
+    state.alfred_notes_seen = set()
+
+
+def _analysis_worker() -> AnalysisWorker:
+    """Return this browser session's poller, starting a new one if it has exited."""
+    worker = st.session_state.analysis_worker
+    if worker is None or not worker.is_alive:
+        worker = AnalysisWorker()
+        st.session_state.analysis_worker = worker
+    return worker
+
+
+def poll_analysis(status: dict[str, Any] | None) -> AnalysisPollView | None:
+    """Fold queued analysis updates into the notes without blocking on HTTP.
+
+    The session id from the status the timeline fragment already polled is
+    handed to the background worker, so an idle sink costs no request and a
+    session change resets the worker's cursor before its next fetch.
+    """
+    # Bind session state once; every attribute access goes through its __getattr__.
+    state = st.session_state
+    worker = _analysis_worker()
+    session_id: str | None = None
+    if status is not None:
+        session_id = (status.get("session") or {}).get("session_id")
+    worker.session_hint = session_id
+    worker.status_known = status is not None
+    if status is not None and not session_id:
+        # Still drain: it marks the fragment as alive (so the idle worker is
+        # not torn down and rebuilt) and drops results for the ended session.
+        worker.drain()
+        return None
+
+    latest: AnalysisPollView | None = state.last_analysis
+    for analysis in worker.drain():
+        if analysis.session_id != state.analysis_session_id:
+            _reset_analysis_state(state, analysis.session_id)
+        _, new_notes, _ = _collect_alfred_notes(analysis, state.alfred_notes_seen)
+        if new_notes:
+            state.alfred_notes.extend(new_notes)
+        latest = analysis
+
+    if latest is not None and session_id and latest.session_id != session_id:
+        # Nothing for the new session has arrived yet.
+        return None
+    return latest
 
 
 def render_notebook(
     status: dict[str, Any] | None,
-    analysis: dict[str, Any] | None,
+    analysis: AnalysisPollView | None,
 ) -> None:
     session = (status or {}).get("session") or {}
     checklist = session.get("checklist") or []
-    running_summary, notes, topics = _collect_alfred_notes(analysis)
-
-    st.markdown("#### Summary")
+    body = analysis.analysis if analysis is not None else None
+    running_summary = body.running_summary if body is not None else ""
+    topics = body.topics if body is not None else []
+    # Bounded to the NOTES_VISIBLE newest notes, which is all the panel shows.
+    notes: deque[str] = st.session_state.alfred_notes
+
+    # Each section's heading and body go out as one markdown element; only
+    # the empty-state captions need an element of their own.
     if running_summary:
-        st.markdown(running_summary)
+        st.markdown(f"#### Summary\n\n{running_summary}")
     else:
+        st.markdown("#### Summary")
         st.caption("Alfred will start summarising once speech or chat arrives.")
 
-    st.markdown("#### Notes")
     if notes:
-        for i, note in enumerate(notes[-30:]):
-            st.markdown(f"- {note}")
+        bullets = "\n".join(f"- {note}" for note in notes)
+        st.markdown(f"#### Notes\n\n{bullets}")
     else:
+        st.markdown("#### Notes")
         st.caption("No notes yet.")
 
-    st.markdown("#### Topics")
     if topics:
         chips = " ".join(
             f"<span class='alfred-topic-chip'>{t}</span>" for t in topics[:16]
         )
-        st.markdown(chips, unsafe_allow_html=True)
+        st.markdown(f"#### Topics\n\n{chips}", unsafe_allow_html=True)
     else:
+        st.markdown("#### Topics")
         st.caption("Topics will appear as the conversation unfolds.")
 
     if checklist:
-        st.markdown("#### Progress")
+        rows: list[str] = []
         for item in checklist:
-            status_value = item.get("status") or "pending"
-            mark = {
-                "complete": "✅",
-                "analyzing": "🟡",
-                "pending": "⬜",
-            }.get(status_value, "⬜")
-            st.markdown(f"{mark} {item.get('label') or item.get('id')}")
+            mark = CHECKLIST_MARKS.get(item.get("status"), DEFAULT_CHECKLIST_MARK)
+            rows.append(f"{mark} {item.get('label') or item.get('id')}")
+        # Two trailing spaces force a markdown line break inside one element.
+        st.markdown("#### Progress\n\n" + "  \n".join(rows))
 
 
 def render_controls(status: dict[str, Any] | None) -> None:
@@ -438,15 +797,29 @@ def render_controls(status: dict[str, Any] | None) -> None:
 
 @st.fragment(run_every=STATUS_POLL_SECONDS)
 def _timeline_fragment() -> None:
-    status = fetch_status()
-    st.session_state.last_status = status
+    state = st.session_state
+    worker = _analysis_worker()
+    # Read before fetching: an event landing mid-fetch triggers another fetch.
+    seq = worker.timeline_seq
+    now = time.monotonic()
+    status = state.last_status
+    if (
+        status is None
+        or not worker.stream_connected
+        or seq != state.status_seq
+        or now - state.status_fetched_at > STATUS_MAX_AGE_SECONDS
+    ):
+        status = fetch_status()
+        state.last_status = status
+        state.status_seq = seq
+        state.status_fetched_at = now
     render_timeline(status)
 
 
 @st.fragment(run_every=ANALYSIS_POLL_SECONDS)
 def _notebook_fragment() -> None:
     status = st.session_state.get("last_status") or fetch_status()
-    analysis = fetch_analysis()
+    analysis = poll_analysis(status)
     st.session_state.last_analysis = analysis
     render_notebook(status, analysis)
 
@@ -7,8 +7,11 @@ simulating real interview conversations between interviewer and candidate.
 Last Grunted: 01/31/2026
 """
 
+import itertools
 import random
-from datetime import datetime, timedelta, timezone
+import time
+from datetime import datetime, timezone
+from functools import lru_cache
 from typing import Optional
 
 from meeting_agent.models import (
@@ -21,12 +24,25 @@ from meeting_agent.models import (
     SessionAnalysis,
 )
 
+# Bound once so the generators skip the module attribute lookup per draw.
+# They share the global Random instance, so random.seed() still applies.
+_choice = random.choice
+_gauss = random.gauss
+_randrange = random.randrange
+_random = random.random
+_sample = random.sample
+_uniform = random.uniform
+
+# Mock ids only need to be unique within a test process.
+_SESSION_COUNTER = itertools.count(1)
+_RESPONSE_COUNTER = itertools.count(1)
+
 
 # =============================================================================
 # Interview Q&A Database - Realistic Technical Interview Content
 # =============================================================================
 
-INTERVIEWER_QUESTIONS = [
+INTERVIEWER_QUESTIONS = (
     "Can you tell me about your experience with Python and what projects you've worked on?",
     "How do you approach debugging a complex distributed system issue?",
     "Describe a challenging technical problem you solved recently.",
@@ -42,9 +58,9 @@ INTERVIEWER_QUESTIONS = [
     "What's your approach to writing maintainable and scalable code?",
     "How do you prioritize tasks when you have multiple deadlines?",
     "Tell me about your experience leading or mentoring other developers.",
-]
+)
 
-CANDIDATE_RESPONSES = [
+CANDIDATE_RESPONSES = (
     "I have 5 years of Python experience, primarily in backend development. Most recently, I built a real-time analytics pipeline using FastAPI and Apache Kafka that processes over 2 million events per day. I also contributed to an open-source async library for PostgreSQL.",
     "When debugging distributed systems, I start by establishing a timeline of events across services using distributed tracing. I check logs from each service involved, looking for correlation IDs. I've found that most issues stem from network partitions or clock drift, so I verify those early.",
     "Last quarter, I tackled a memory leak in our Python service that only appeared under high load. After extensive profiling with py-spy and memory_profiler, I discovered we were holding references to closed database connections. The fix involved implementing proper context managers and connection pooling.",
@@ -60,37 +76,94 @@ CANDIDATE_RESPONSES = [
     "I follow SOLID principles and favor composition over inheritance. I write code assuming the next person reading it won't have context. Clear naming, small functions, and comprehensive type hints make a huge difference. I also refactor continuously rather than letting tech debt accumulate.",
     "I use a combination of urgency and impact assessment. I communicate early if I see conflicts, and I'm not afraid to push back on unrealistic timelines with data. I also try to identify tasks that can be parallelized or delegated.",
     "I've mentored 3 junior developers and led a team of 5 for a year-long project. I believe in pairing sessions for knowledge transfer and creating a safe environment for questions. Regular 1:1s help me understand each person's growth goals.",
-]
+)
 
-FOLLOW_UP_QUESTIONS = [
+FOLLOW_UP_QUESTIONS = (
     "Can you elaborate on that?",
     "Interesting. How did that work in practice?",
     "What challenges did you face with that approach?",
     "That's great. How long did that take to implement?",
     "What would you do differently if you could start over?",
-]
+)
+
+_OPENING = "Thanks for joining today. I'm the hiring manager for this position. Let's get started."
+_CLOSING = "That wraps up our questions. Do you have any questions for us?"
+_OPENING_AUDIO_DELTA_MS = len(_OPENING.split()) * 400 + 500
+
+_FOLLOW_UP_SUGGESTIONS = (
+    "Ask for specific examples or metrics",
+    "Probe deeper on technical implementation details",
+    "Clarify the timeline and scope of the project",
+)
+# Every one- and two-suggestion pick, so one draw selects a combination.
+_FOLLOW_UP_COMBOS = (
+    *((s,) for s in _FOLLOW_UP_SUGGESTIONS),
+    *itertools.combinations(_FOLLOW_UP_SUGGESTIONS, 2),
+)
+
+# Per-position word counts, indexed alongside the sampled question/response order.
+_QUESTION_WORDS = tuple(len(q.split()) for q in INTERVIEWER_QUESTIONS)
+_RESPONSE_WORDS = tuple(len(r.split()) for r in CANDIDATE_RESPONSES)
+
+# Word counts for the canned lines, which every conversation reuses.
+_WORD_COUNTS: dict[str, int] = {
+    text: len(text.split())
+    for text in (
+        *INTERVIEWER_QUESTIONS, *CANDIDATE_RESPONSES, *FOLLOW_UP_QUESTIONS, _OPENING, _CLOSING
+    )
+}
+
+
+def _word_count(text: str) -> int:
+    """Return the word count of ``text``, using the precomputed table when possible."""
+    count = _WORD_COUNTS.get(text)
+    return count if count is not None else len(text.split())
 
 
 # =============================================================================
 # Timestamp Generation
 # =============================================================================
 
+def _unix_ms() -> int:
+    """Return the current UTC time as integer milliseconds since the epoch."""
+    return time.time_ns() // 1_000_000
+
+
+def _iso_from_unix_ms(unix_ms: int) -> str:
+    """Format epoch milliseconds as an ISO 8601 UTC string with a 'Z' suffix."""
+    seconds, millis = divmod(unix_ms, 1000)
+    t = time.gmtime(seconds)
+    return (
+        f"{t.tm_year:04d}-{t.tm_mon:02d}-{t.tm_mday:02d}T"
+        f"{t.tm_hour:02d}:{t.tm_min:02d}:{t.tm_sec:02d}.{millis:03d}Z"
+    )
+
+
 def _iso_timestamp(offset_seconds: float = 0) -> str:
     """Generate ISO 8601 UTC timestamp with optional offset."""
-    ts = datetime.now(timezone.utc) + timedelta(seconds=offset_seconds)
-    return ts.strftime("%Y-%m-%dT%H:%M:%S.") + f"{ts.microsecond:06d}"[:3] + "Z"
+    unix_ms = _unix_ms()
+    if offset_seconds:
+        unix_ms += round(offset_seconds * 1000)
+    return _iso_from_unix_ms(unix_ms)
 
 
-def _generate_audio_timing(duration_ms: float, offset_ms: float = 0) -> tuple[float, float]:
-    """Generate realistic audio start/end times."""
-    start = offset_ms + random.uniform(0, 100)
-    end = start + duration_ms
-    return round(start, 1), round(end, 1)
+def _event_metadata(
+    provider: str,
+    raw_response: Optional[dict[str, object]] = None,
+) -> EventMetadata:
+    """Build metadata for one generated event.
+
+    A fresh instance per event: ``raw_response`` is a mutable dict, so
+    sharing one instance across events would let a test's edit leak.
+    """
+    return EventMetadata.model_construct(provider=provider, raw_response=raw_response)
 
 
 # =============================================================================
 # Event Generators
 # =============================================================================
+# Generated field values are in range by construction, so the generators
+# build events with model_construct and skip pydantic validation.
 
 def generate_session_start_event(
     timestamp_offset: float = 0,
@@ -106,7 +179,7 @@ def generate_session_start_event(
     Returns:
         TranscriptEvent with event_type="session_started"
     """
-    return TranscriptEvent(
+    return TranscriptEvent.model_construct(
         event_type="session_started",
         text=None,
         timestamp_utc=_iso_timestamp(timestamp_offset),
@@ -114,9 +187,8 @@ def generate_session_start_event(
         audio_start_ms=None,
         audio_end_ms=None,
         confidence=None,
-        metadata=EventMetadata(
-            provider=provider,
-            raw_response={"session_id": f"sess_{random.randint(10000, 99999)}"},
+        metadata=_event_metadata(
+            provider, {"session_id": f"sess_{next(_SESSION_COUNTER):05d}"}
         ),
     )
 
@@ -135,7 +207,7 @@ def generate_session_stop_event(
     Returns:
         TranscriptEvent with event_type="session_stopped"
     """
-    return TranscriptEvent(
+    return TranscriptEvent.model_construct(
         event_type="session_stopped",
         text=None,
         timestamp_utc=_iso_timestamp(timestamp_offset),
@@ -143,9 +215,7 @@ def generate_session_stop_event(
         audio_start_ms=None,
         audio_end_ms=None,
         confidence=None,
-        metadata=EventMetadata(
-            provider=provider,
-        ),
+        metadata=_event_metadata(provider),
     )
 
 
@@ -176,16 +246,19 @@ def generate_transcript_event(
         TranscriptEvent matching v2 format.
     """
     # Estimate duration based on text length (avg 150 words/min = 400ms/word)
-    word_count = len(text.split())
-    duration_ms = word_count * 400 + random.uniform(-50, 50)
+    word_count = _word_count(text)
+    duration_ms = word_count * 400 + _uniform(-50, 50)
     
-    audio_start, audio_end = _generate_audio_timing(duration_ms, audio_offset_ms)
+    # Realistic audio start/end times with a small onset jitter.
+    start = audio_offset_ms + _uniform(0, 100)
+    audio_start = round(start, 1)
+    audio_end = round(start + duration_ms, 1)
     
     if confidence is None:
         # Realistic confidence distribution (mostly high, occasionally lower)
-        confidence = min(1.0, max(0.5, random.gauss(0.92, 0.05)))
+        confidence = min(1.0, max(0.5, _gauss(0.92, 0.05)))
     
-    return TranscriptEvent(
+    return TranscriptEvent.model_construct(
         event_type=event_type,
         text=text,
         timestamp_utc=_iso_timestamp(timestamp_offset),
@@ -193,10 +266,7 @@ def generate_transcript_event(
         audio_start_ms=audio_start,
         audio_end_ms=audio_end,
         confidence=round(confidence, 3),
-        metadata=EventMetadata(
-            provider=provider,
-            raw_response={"model": model},
-        ),
+        metadata=_event_metadata(provider, {"model": model}),
     )
 
 
@@ -230,8 +300,12 @@ def generate_interview_conversation(
     time_offset = 0.0
     
     # Select random questions and responses
-    questions = random.sample(INTERVIEWER_QUESTIONS, min(num_exchanges, len(INTERVIEWER_QUESTIONS)))
-    responses = random.sample(CANDIDATE_RESPONSES, min(num_exchanges, len(CANDIDATE_RESPONSES)))
+    question_order = _sample(
+        range(len(INTERVIEWER_QUESTIONS)), min(num_exchanges, len(INTERVIEWER_QUESTIONS))
+    )
+    response_order = _sample(
+        range(len(CANDIDATE_RESPONSES)), min(num_exchanges, len(CANDIDATE_RESPONSES))
+    )
     
     # Session start
     if include_session_events:
@@ -239,25 +313,26 @@ def generate_interview_conversation(
         time_offset += 1.0
     
     # Opening from interviewer
-    opening = f"Thanks for joining today. I'm the hiring manager for this position. Let's get started."
     events.append(generate_transcript_event(
         speaker_id=interviewer_speaker_id,
-        text=opening,
+        text=_OPENING,
         timestamp_offset=time_offset,
         audio_offset_ms=audio_offset,
     ))
     
     # Update offsets
-    audio_offset += len(opening.split()) * 400 + 500
+    audio_offset += _OPENING_AUDIO_DELTA_MS
     time_offset += 3.0
     
     # Q&A exchanges
     for i in range(num_exchanges):
-        question = questions[i]
-        response = responses[i]
+        question_index = question_order[i]
+        response_index = response_order[i]
+        question = INTERVIEWER_QUESTIONS[question_index]
+        response = CANDIDATE_RESPONSES[response_index]
         
         # Optional: Generate partial for question
-        if include_partials and random.random() > 0.5:
+        if include_partials and _random() > 0.5:
             partial_text = " ".join(question.split()[:3]) + "..."
             events.append(generate_transcript_event(
                 speaker_id=interviewer_speaker_id,
@@ -276,11 +351,12 @@ def generate_interview_conversation(
             audio_offset_ms=audio_offset,
         ))
         
-        audio_offset += len(question.split()) * 400 + 1000  # + pause
-        time_offset += len(question.split()) * 0.4 + 2.0
+        question_words = _QUESTION_WORDS[question_index]
+        audio_offset += question_words * 400 + 1000  # + pause
+        time_offset += question_words * 0.4 + 2.0
         
         # Optional: Generate partial for response
-        if include_partials and random.random() > 0.5:
+        if include_partials and _random() > 0.5:
             partial_text = " ".join(response.split()[:5]) + "..."
             events.append(generate_transcript_event(
                 speaker_id=candidate_speaker_id,
@@ -299,31 +375,30 @@ def generate_interview_conversation(
             audio_offset_ms=audio_offset,
         ))
         
-        audio_offset += len(response.split()) * 400 + 1500  # + longer pause
-        time_offset += len(response.split()) * 0.4 + 3.0
+        response_words = _RESPONSE_WORDS[response_index]
+        audio_offset += response_words * 400 + 1500  # + longer pause
+        time_offset += response_words * 0.4 + 3.0
         
         # Occasional follow-up
-        if i < num_exchanges - 1 and random.random() > 0.7:
-            follow_up = random.choice(FOLLOW_UP_QUESTIONS)
+        if i < num_exchanges - 1 and _random() > 0.7:
+            follow_up = _choice(FOLLOW_UP_QUESTIONS)
             events.append(generate_transcript_event(
                 speaker_id=interviewer_speaker_id,
                 text=follow_up,
                 timestamp_offset=time_offset,
                 audio_offset_ms=audio_offset,
             ))
-            audio_offset += len(follow_up.split()) * 400 + 500
+            audio_offset += _word_count(follow_up) * 400 + 500
             time_offset += 2.0
     
     # Closing from interviewer
-    closing = "That wraps up our questions. Do you have any questions for us?"
     events.append(generate_transcript_event(
         speaker_id=interviewer_speaker_id,
-        text=closing,
+        text=_CLOSING,
         timestamp_offset=time_offset,
         audio_offset_ms=audio_offset,
     ))
     
-    audio_offset += len(closing.split()) * 400 + 500
     time_offset += 3.0
     
     # Session stop
@@ -333,6 +408,28 @@ def generate_interview_conversation(
     return events
 
 
+def generate_interview_conversations(
+    count: int,
+    num_exchanges: int = 5,
+    **kwargs: object,
+) -> list[list[TranscriptEvent]]:
+    """
+    Generate several independent interview conversations.
+    
+    Args:
+        count: Number of conversations to generate.
+        num_exchanges: Number of Q&A exchanges per conversation.
+        **kwargs: Forwarded to ``generate_interview_conversation``.
+        
+    Returns:
+        One list of TranscriptEvent objects per conversation.
+    """
+    return [
+        generate_interview_conversation(num_exchanges=num_exchanges, **kwargs)
+        for _ in range(count)
+    ]
+
+
 # =============================================================================
 # Analysis Mock Generators
 # =============================================================================
@@ -356,28 +453,22 @@ def generate_analysis_item(
         AnalysisItem with realistic analysis data.
     """
     if response_id is None:
-        response_id = f"resp_{random.randint(1000, 9999)}"
+        response_id = f"resp_{next(_RESPONSE_COUNTER):04d}"
     
     if response_text is None:
-        response_text = random.choice(CANDIDATE_RESPONSES)
+        response_text = _choice(CANDIDATE_RESPONSES)
     
     if question_text is None:
-        question_text = random.choice(INTERVIEWER_QUESTIONS)
+        question_text = _choice(INTERVIEWER_QUESTIONS)
     
     # Generate realistic scores (mostly good, some variation)
-    relevance = min(1.0, max(0.0, random.gauss(0.82, 0.10)))
-    clarity = min(1.0, max(0.0, random.gauss(0.85, 0.08)))
+    relevance = min(1.0, max(0.0, _gauss(0.82, 0.10)))
+    clarity = min(1.0, max(0.0, _gauss(0.85, 0.08)))
     
     # Extract key points (simple simulation)
-    sentences = response_text.split(". ")
-    key_points = [s.strip()[:60] + "..." for s in sentences[:3] if len(s) > 20]
-    
-    # Generate follow-up suggestions
-    follow_ups = [
-        "Ask for specific examples or metrics",
-        "Probe deeper on technical implementation details",
-        "Clarify the timeline and scope of the project",
-    ]
+    # Only the first three sentences are considered, so stop splitting there.
+    sentences = response_text.split(". ", 3)[:3]
+    key_points = [f"{s.strip()[:60]}..." for s in sentences if len(s) > 20]
     
     return AnalysisItem(
         response_id=response_id,
@@ -387,7 +478,7 @@ def generate_analysis_item(
         relevance_score=round(relevance, 2),
         clarity_score=round(clarity, 2),
         key_points=key_points,
-        follow_up_suggestions=random.sample(follow_ups, k=random.randint(1, 2)),
+        follow_up_suggestions=list(_FOLLOW_UP_COMBOS[_randrange(len(_FOLLOW_UP_COMBOS))]),
     )
 
 
@@ -395,6 +486,7 @@ def generate_session_analysis(
     session_id: Optional[str] = None,
     candidate_name: str = "Alex Johnson",
     num_items: int = 5,
+    seed: Optional[int] = None,
 ) -> SessionAnalysis:
     """
     Generate a complete mock SessionAnalysis.
@@ -403,13 +495,42 @@ def generate_session_analysis(
         session_id: Unique session ID. Auto-generated if None.
         candidate_name: Name of the candidate.
         num_items: Number of analysis items to generate.
+        seed: Seed for a reproducible analysis. Seeded results are built
+            once per argument set and returned as independent copies.
         
     Returns:
         SessionAnalysis with computed overall scores.
     """
+    if seed is None:
+        return _build_session_analysis(session_id, candidate_name, num_items)
+    cached = _seeded_session_analysis(session_id, candidate_name, num_items, seed)
+    return cached.model_copy(deep=True)
+
+
+@lru_cache(maxsize=128)
+def _seeded_session_analysis(
+    session_id: Optional[str],
+    candidate_name: str,
+    num_items: int,
+    seed: int,
+) -> SessionAnalysis:
+    """Build a seeded analysis without disturbing the global random stream."""
+    state = random.getstate()
+    random.seed(seed)
+    try:
+        return _build_session_analysis(session_id, candidate_name, num_items)
+    finally:
+        random.setstate(state)
+
+
+def _build_session_analysis(
+    session_id: Optional[str],
+    candidate_name: str,
+    num_items: int,
+) -> SessionAnalysis:
     if session_id is None:
         ts = datetime.now(timezone.utc).strftime("%Y%m%d_%H%M%S")
-        session_id = f"int_{ts}_{random.randint(1000, 9999):04x}"
+        session_id = f"int_{ts}_{next(_SESSION_COUNTER):04x}"
     
     started_at = _iso_timestamp(-3600)  # 1 hour ago
     ended_at = _iso_timestamp(-60)  # 1 minute ago
@@ -436,27 +557,39 @@ def generate_v2_event_dict(
     speaker_id: str = "speaker_0",
     text: str = "Test transcript text",
     event_type: str = "final",
+    deterministic: bool = False,
 ) -> dict:
     """
     Generate a dictionary matching the exact v2 JSON format from C# bot.
     
     Useful for testing JSON parsing and API endpoints.
     
+    Args:
+        speaker_id: Speaker identifier.
+        text: Transcript text content.
+        event_type: Event type ("partial" or "final").
+        deterministic: Use fixed audio timing and confidence instead of
+            random draws, for tests that only check structure.
+    
     Returns:
         Dictionary matching v2 transcript event JSON schema.
     """
-    word_count = len(text.split())
-    audio_start = random.uniform(1000, 5000)
-    audio_end = audio_start + word_count * 400
+    word_count = _word_count(text)
+    if deterministic:
+        audio_start = 1000.0
+        confidence = 0.93
+    else:
+        audio_start = round(_uniform(1000, 5000), 1)
+        confidence = round(_uniform(0.88, 0.98), 2)
     
     return {
         "event_type": event_type,
         "text": text,
         "timestamp_utc": _iso_timestamp(),
         "speaker_id": speaker_id,
-        "audio_start_ms": round(audio_start, 1),
-        "audio_end_ms": round(audio_end, 1),
-        "confidence": round(random.uniform(0.88, 0.98), 2),
+        "audio_start_ms": audio_start,
+        "audio_end_ms": round(audio_start + word_count * 400, 1),
+        "confidence": confidence,
         "metadata": {"provider": "deepgram", "model": "nova-3"},
     }
 
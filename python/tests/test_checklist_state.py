@@ -0,0 +1,57 @@
+"""Tests for the sink-owned checklist state manager."""
+
+from __future__ import annotations
+
+from meeting_agent.checklist_state import (
+    ChecklistDefinition,
+    ChecklistStateManager,
+    ChecklistStatus,
+)
+
+
+def _manager() -> ChecklistStateManager:
+    return ChecklistStateManager(
+        [
+            ChecklistDefinition(id="intro", label="Intro", keywords=("Welcome", "hello")),
+            ChecklistDefinition(id="python", label="Python", keywords=("python", "pytest")),
+            ChecklistDefinition(id="testing", label="Testing", keywords=("test",)),
+        ]
+    )
+
+
+def _status(manager: ChecklistStateManager, item_id: str) -> str | None:
+    return next(row["status"] for row in manager.snapshot() if row["id"] == item_id)
+
+
+def test_heuristic_prefers_first_defined_item() -> None:
+    manager = _manager()
+
+    # "pytest" (python) and "test" (testing) overlap; "hello" appears last
+    # in the text but belongs to the first-defined item.
+    assert manager.apply_alfred_heuristic("We use PyTest, hello", "interviewer")
+
+    assert _status(manager, "intro") == ChecklistStatus.ANALYZING.value
+    assert _status(manager, "python") == ChecklistStatus.PENDING.value
+    assert _status(manager, "testing") == ChecklistStatus.PENDING.value
+
+
+def test_heuristic_matches_overlapping_keywords() -> None:
+    manager = _manager()
+
+    assert manager.apply_alfred_heuristic("unit testing with pytest", "interviewer")
+
+    assert _status(manager, "python") == ChecklistStatus.ANALYZING.value
+
+
+def test_heuristic_completes_on_candidate_reply() -> None:
+    manager = _manager()
+    manager.apply_alfred_heuristic("Tell me about Python", "interviewer")
+
+    assert manager.apply_alfred_heuristic("I write python daily", "candidate")
+    assert _status(manager, "python") == ChecklistStatus.COMPLETE.value
+
+
+def test_heuristic_ignores_text_without_keywords() -> None:
+    manager = _manager()
+
+    assert manager.apply_alfred_heuristic("Nothing relevant here", "candidate") is False
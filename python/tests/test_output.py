@@ -0,0 +1,154 @@
+"""Tests for AnalysisOutputWriter persistence."""
+
+from __future__ import annotations
+
+import json
+from pathlib import Path
+
+from meeting_agent.models import AnalysisItem
+from meeting_agent.output import MAX_CACHED_SESSIONS, AnalysisOutputWriter
+
+
+def _item(response_id: str) -> AnalysisItem:
+    return AnalysisItem(
+        response_id=response_id,
+        response_text=f"Response {response_id}",
+        relevance_score=0.8,
+        clarity_score=0.6,
+    )
+
+
+def test_load_analysis_returns_independent_copies(tmp_path: Path) -> None:
+    writer = AnalysisOutputWriter(tmp_path)
+    writer.append_item("s1", _item("r1"))
+
+    first = writer.load_analysis("s1")
+    assert first is not None
+    first.analysis_items.clear()
+
+    second = writer.load_analysis("s1")
+    assert second is not None
+    assert [item.response_id for item in second.analysis_items] == ["r1"]
+
+
+def test_load_analysis_sees_new_writes(tmp_path: Path) -> None:
+    writer = AnalysisOutputWriter(tmp_path)
+    writer.append_item("s1", _item("r1"))
+    assert writer.load_analysis("s1") is not None
+
+    writer.append_item("s1", _item("r2"))
+    analysis = writer.load_analysis("s1")
+
+    assert analysis is not None
+    assert [item.response_id for item in analysis.analysis_items] == ["r1", "r2"]
+
+
+def test_delete_analysis_missing_session(tmp_path: Path) -> None:
+    writer = AnalysisOutputWriter(tmp_path)
+    assert writer.delete_analysis("missing") is False
+
+
+def test_load_analysis_since_returns_item_tail(tmp_path: Path) -> None:
+    writer = AnalysisOutputWriter(tmp_path)
+    for response_id in ("r1", "r2", "r3"):
+        writer.append_item("s1", _item(response_id))
+
+    analysis, total = writer.load_analysis_since("s1", 2)
+
+    assert total == 3
+    assert analysis is not None
+    assert [item.response_id for item in analysis.analysis_items] == ["r3"]
+    analysis.analysis_items.clear()
+    full = writer.load_analysis("s1")
+    assert full is not None
+    assert len(full.analysis_items) == 3
+    assert writer.load_analysis_since("missing", 1) == (None, 0)
+
+
+def test_append_item_rereads_file_changed_by_another_writer(tmp_path: Path) -> None:
+    writer = AnalysisOutputWriter(tmp_path)
+    other = AnalysisOutputWriter(tmp_path)
+    writer.append_item("s1", _item("r1"))
+    other.append_item("s1", _item("r2"))
+    writer.append_item("s1", _item("r3"))
+
+    analysis = writer.load_analysis("s1")
+    assert analysis is not None
+    assert [item.response_id for item in analysis.analysis_items] == ["r1", "r2", "r3"]
+    assert analysis.total_responses_analyzed == 3
+
+
+def test_append_item_keeps_running_overall_scores(tmp_path: Path) -> None:
+    writer = AnalysisOutputWriter(tmp_path)
+    writer.append_item("s1", _item("r1"))
+    writer.append_item(
+        "s1",
+        AnalysisItem(response_id="r2", response_text="Unscored", relevance_score=None, clarity_score=None),
+    )
+    writer.append_item(
+        "s1",
+        AnalysisItem(response_id="r3", response_text="Response r3", relevance_score=0.4, clarity_score=0.2),
+    )
+
+    analysis = writer.load_analysis("s1")
+    assert analysis is not None
+    assert analysis.overall_relevance == (0.8 + 0.4) / 2
+    assert analysis.overall_clarity == (0.6 + 0.2) / 2
+    assert "score_totals" not in json.loads((tmp_path / "s1_analysis.json").read_text())["_meta"]
+
+    # A fresh writer has no cached totals and recomputes them from the file.
+    AnalysisOutputWriter(tmp_path).append_item("s1", _item("r4"))
+    analysis = writer.load_analysis("s1")
+    assert analysis is not None
+    assert analysis.overall_relevance == (0.8 + 0.4 + 0.8) / 3
+
+
+def test_list_sessions_returns_sorted_session_ids(tmp_path: Path) -> None:
+    writer = AnalysisOutputWriter(tmp_path)
+    for session_id in ("s2", "s1"):
+        writer.append_item(session_id, _item("r1"))
+    (tmp_path / "notes.txt").write_text("ignored", encoding="utf-8")
+
+    assert writer.list_sessions() == ["s1", "s2"]
+
+
+def test_snapshot_writes_leave_no_temp_file(tmp_path: Path) -> None:
+    writer = AnalysisOutputWriter(tmp_path)
+    writer.append_item("s1", _item("r1"))
+
+    assert [path.name for path in tmp_path.iterdir()] == ["s1_analysis.json"]
+
+
+def test_append_cache_keeps_only_recent_sessions(tmp_path: Path) -> None:
+    writer = AnalysisOutputWriter(tmp_path)
+    session_ids = [f"s{i}" for i in range(MAX_CACHED_SESSIONS + 2)]
+    for session_id in session_ids:
+        writer.append_item(session_id, _item("r1"))
+
+    assert list(writer._append_cache) == session_ids[-MAX_CACHED_SESSIONS:]
+
+    latest = session_ids[-1]
+    analysis = writer.load_analysis(latest)
+    assert analysis is not None
+    writer.write_analysis(latest, analysis)
+    assert latest not in writer._append_cache
+
+
+def test_load_cache_keeps_only_recent_sessions(tmp_path: Path) -> None:
+    writer = AnalysisOutputWriter(tmp_path)
+    session_ids = [f"s{i}" for i in range(MAX_CACHED_SESSIONS + 2)]
+    for session_id in session_ids:
+        writer.append_item(session_id, _item("r1"))
+        writer.load_analysis(session_id)
+
+    oldest_cached = session_ids[-MAX_CACHED_SESSIONS]
+    next_oldest = session_ids[-MAX_CACHED_SESSIONS + 1]
+    assert list(writer._load_cache) == session_ids[-MAX_CACHED_SESSIONS:]
+
+    # A cache hit counts as a use, so the next miss evicts another session.
+    writer.load_analysis(oldest_cached)
+    writer.load_analysis(session_ids[0])
+
+    assert len(writer._load_cache) == MAX_CACHED_SESSIONS
+    assert oldest_cached in writer._load_cache
+    assert next_oldest not in writer._load_cache
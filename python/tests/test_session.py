@@ -0,0 +1,92 @@
+"""Tests for InterviewSessionManager chat and transcript ingestion."""
+
+from __future__ import annotations
+
+from meeting_agent.models import ChatMessage
+from meeting_agent.session import InterviewSessionManager
+from tests.mock_data import generate_transcript_event
+
+
+def _chat(message_id: str, **fields: object) -> ChatMessage:
+    return ChatMessage(
+        chat_thread_id="19:thread",
+        message_id=message_id,
+        timestamp_utc="2026-01-31T10:30:00.000Z",
+        **fields,
+    )
+
+
+def test_duplicate_chat_message_backfills_existing() -> None:
+    manager = InterviewSessionManager()
+    manager.start_session("Meeting", "https://teams.microsoft.com/l/meetup-join/")
+
+    assert manager.add_chat_message(_chat("m1", text="hello")) is not None
+    assert manager.add_chat_message(_chat("m1", html="<p>hello</p>")) is None
+
+    session = manager.session
+    assert session is not None
+    assert len(session.chat_messages) == 1
+    assert session.chat_messages[0].html == "<p>hello</p>"
+
+
+def test_new_session_forgets_previous_chat_messages() -> None:
+    manager = InterviewSessionManager()
+    manager.start_session("First", "https://teams.microsoft.com/l/meetup-join/")
+    manager.add_chat_message(_chat("m1", text="hello"))
+
+    manager.start_session("Second", "https://teams.microsoft.com/l/meetup-join/")
+
+    assert manager.add_chat_message(_chat("m1", text="hello")) is not None
+
+
+def test_transcript_lookups_use_final_events_per_speaker() -> None:
+    manager = InterviewSessionManager()
+    manager.start_session("Jane Doe", "https://teams.microsoft.com/l/meetup-join/")
+    manager.map_speaker("speaker_0", "interviewer")
+    manager.map_speaker("speaker_1", "candidate")
+
+    manager.add_transcript(generate_transcript_event("speaker_0", "Tell me about Python?"))
+    manager.add_transcript(generate_transcript_event("speaker_1", "I use", event_type="partial"))
+    for text in ("First answer.", "Second answer.", "Third answer."):
+        manager.add_transcript(generate_transcript_event("speaker_1", text))
+
+    assert [e.text for e in manager.get_candidate_transcripts(count=2)] == [
+        "Second answer.",
+        "Third answer.",
+    ]
+    assert len(manager.get_candidate_transcripts(final_only=False)) == 4
+    assert len(manager.get_recent_transcripts(count=10)) == 4
+    assert manager.get_last_interviewer_question() == "Tell me about Python?"
+
+    manager.start_session("Next", "https://teams.microsoft.com/l/meetup-join/")
+    manager.map_speaker("speaker_1", "candidate")
+    assert manager.get_candidate_transcripts() == []
+
+
+def test_candidate_speaker_follows_remapping() -> None:
+    manager = InterviewSessionManager()
+    manager.start_session("Jane Doe", "https://teams.microsoft.com/l/meetup-join/")
+    assert manager.get_candidate_speaker_id() is None
+
+    manager.map_speaker("speaker_0", "interviewer")
+    manager.map_speaker("speaker_1", "candidate")
+    assert manager.get_candidate_speaker_id() == "speaker_1"
+
+    manager.map_speaker("speaker_1", "interviewer")
+    assert manager.get_candidate_speaker_id() is None
+
+
+def test_recent_conversation_keeps_slice_semantics_for_non_positive_count() -> None:
+    manager = InterviewSessionManager()
+    manager.start_session("Jane Doe", "https://teams.microsoft.com/l/meetup-join/")
+    manager.map_speaker("speaker_0", "interviewer")
+    manager.map_speaker("speaker_1", "candidate")
+    for speaker_id, text in (("speaker_0", "One."), ("speaker_1", "Two."), ("speaker_0", "Three.")):
+        manager.add_transcript(generate_transcript_event(speaker_id, text))
+
+    def texts(count: int) -> list[str | None]:
+        return [turn["text"] for turn in manager.get_recent_conversation(count=count)]
+
+    assert texts(2) == ["Two.", "Three."]
+    assert texts(0) == ["One.", "Two.", "Three."]
+    assert texts(-1) == ["Two.", "Three."]
@@ -10,6 +10,7 @@ Last Grunted: 02/05/2026
 from __future__ import annotations
 
 import asyncio
+import random
 from datetime import datetime, timezone
 from typing import TYPE_CHECKING
 
@@ -22,6 +23,7 @@ from simulation_engine import (
     SentMessage,
     SimulationEngine,
     SimulationState,
+    build_delay_schedule,
     calculate_delay,
     generate_session_event,
     generate_transcript_event,
@@ -123,6 +125,14 @@ class TestCalculateDelay:
         assert 3.0 <= short_delay <= 5.0
         assert 3.0 <= long_delay <= 5.0
 
+    def test_delay_schedule_is_replayable(self):
+        """Same seed produces the same per-message delay schedule."""
+        first = build_delay_schedule(random.Random(42))
+        second = build_delay_schedule(random.Random(42))
+
+        assert first == second
+        assert len(first) == len(INTERVIEW_SCRIPT)
+
 
 # =============================================================================
 # SimulationState Tests
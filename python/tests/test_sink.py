@@ -202,6 +202,10 @@ def _reset_app_state(app) -> None:
             session_manager.end_session()
         session_manager._session = None
         session_manager._speaker_roles = {}
+        session_manager._candidate_speaker_id = None
+        session_manager._chat_message_index = {}
+        session_manager._final_transcripts = []
+        session_manager._final_transcripts_by_speaker = {}
 
     if hasattr(app.state, "session_registry"):
         registry = app.state.session_registry
@@ -508,6 +512,57 @@ class TestSpeakerMapEndpoint:
         assert "no active session" in data["error"].lower()
 
 
+class TestSessionBootstrapEndpoint:
+    """Tests for POST /session/bootstrap endpoint."""
+
+    @pytest.mark.asyncio
+    async def test_bootstrap_starts_session_and_maps_speakers(
+        self, client: AsyncClient
+    ) -> None:
+        """Bootstrap starts a session, maps speakers, and ingests events."""
+        response = await client.post(
+            "/session/bootstrap",
+            json={
+                "candidate_name": "Test",
+                "meeting_url": "https://test.com",
+                "speakers": [
+                    {"speaker_id": "speaker_0", "role": "interviewer"},
+                    {"speaker_id": "speaker_1", "role": "candidate"},
+                ],
+                "events": [
+                    generate_v2_event_dict(
+                        speaker_id="speaker_0",
+                        text="Welcome to the interview.",
+                        event_type="final",
+                    )
+                ],
+            },
+        )
+
+        assert response.status_code == 200
+        data = response.json()
+        assert data["ok"] is True
+        assert data["session_id"].startswith("int_")
+        assert data["speaker_mappings"] == {
+            "speaker_0": "interviewer",
+            "speaker_1": "candidate",
+        }
+        assert data["events_ingested"] == 1
+
+        session = (await client.get("/session")).json()["session"]
+        assert session["total_events"] >= 1
+
+    @pytest.mark.asyncio
+    async def test_bootstrap_rejects_active_session(self, client: AsyncClient) -> None:
+        """Bootstrap fails like /session/start when a session is active."""
+        body = {"candidate_name": "Test", "meeting_url": "https://test.com"}
+        await client.post("/session/start", json=body)
+
+        response = await client.post("/session/bootstrap", json=body)
+
+        assert response.status_code == 409
+
+
 # =============================================================================
 # Transcript Endpoint Tests
 # =============================================================================
@@ -332,6 +332,19 @@ class SpeakerMapRequest(BaseModel):
     role: SpeakerRole = Field(..., description="Role: candidate or interviewer")
 
 
+class SessionBootstrapRequest(SessionStartRequest):
+    """Request to start a session, map speakers, and ingest opening events in one call."""
+
+    speakers: list[SpeakerMapRequest] = Field(
+        default_factory=list,
+        description="Speaker mappings applied in order after the session starts",
+    )
+    events: list[TranscriptEventRequest] = Field(
+        default_factory=list,
+        description="Transcript events (e.g. session_started) ingested after mapping",
+    )
+
+
 class MuteRequest(BaseModel):
     """Body for POST /m/{chat_thread_id}/mute."""
 
@@ -467,6 +480,15 @@ class SpeakerMapResponse(BaseResponse):
     )
 
 
+class SessionBootstrapResponse(SessionStartResponse):
+    """Response for session bootstrap."""
+
+    speaker_mappings: dict[str, str] = Field(
+        default_factory=dict, description="Speaker-to-role mappings after bootstrap"
+    )
+    events_ingested: int = Field(default=0, description="Opening events processed")
+
+
 class SessionStatusResponse(BaseModel):
     """Session status information."""
 
@@ -538,6 +560,10 @@ class SessionAnalysisResponse(BaseResponse):
         default=None,
         description="Current persisted analysis, if available",
     )
+    total_items: int = Field(
+        default=0,
+        description="Total analysis items; analysis_items holds only those after `since`",
+    )
 
 
 class SessionEndResponse(BaseResponse):
@@ -1269,6 +1295,16 @@ async def agent_processing_loop(
                             analysis_item,
                             checklist_state=checklist_manager.snapshot(),
                         )
+                        # Published after the write so subscribers that
+                        # re-read /session/analysis on it see the new item.
+                        await event_bus.publish(
+                            "analysis_item",
+                            {
+                                "session_id": session_manager.session.session_id,
+                                "response_id": analysis_item.response_id,
+                            },
+                            session_id=session_manager.session.session_id,
+                        )
                         payload = {
                             "event_type": "analysis",
                             "product_id": PRODUCT_SPEC.product_id,
@@ -1678,9 +1714,13 @@ async def receive_transcript(
                 session_manager.get_speaker_role(event.speaker_id) if event.speaker_id else None
             ) or "unknown"
 
+            # Lowercase once; both keyword passes below reuse it.
+            text_lower = event.text.lower() if event.text else ""
+
             if event.text and checklist_manager.apply_alfred_heuristic(
                 text=event.text,
                 speaker_role=speaker_role,
+                text_lower=text_lower,
             ):
                 stats["checklist_updates"] += 1
 
@@ -1692,6 +1732,7 @@ async def receive_transcript(
                     conversation_history=session_manager.get_session_context().get(
                         "recent_conversation", []
                     ),
+                    text_lower=text_lower,
                 )
                 if checklist_result:
                     updated = checklist_manager.update(
@@ -2121,6 +2162,45 @@ async def map_speaker(
     )
 
 
+@app.post("/session/bootstrap", response_model=SessionBootstrapResponse)
+async def bootstrap_session(
+    request: SessionBootstrapRequest,
+    state: AppStateDep,
+) -> SessionBootstrapResponse:
+    """
+    Start a session, map speakers, and ingest opening events in one round-trip.
+
+    Equivalent to ``/session/start`` followed by one ``/session/map-speaker``
+    per speaker and one transcript ingest per event, processed in that order.
+
+    Args:
+        request: Session start parameters plus speakers and events.
+        state: Application state from dependency injection.
+
+    Returns:
+        SessionBootstrapResponse with session details and speaker mappings.
+
+    Raises:
+        SessionAlreadyActiveError: If a session is already active.
+    """
+    session_manager = state["session_manager"]
+
+    started = await start_session(request, state)
+    for speaker in request.speakers:
+        session_manager.map_speaker(speaker.speaker_id, speaker.role.value)
+    for event in request.events:
+        await receive_transcript(event, state)
+
+    return SessionBootstrapResponse(
+        ok=True,
+        message=started.message,
+        session_id=started.session_id,
+        started_at=started.started_at,
+        speaker_mappings=session_manager.get_session_context()["speaker_mappings"],
+        events_ingested=len(request.events),
+    )
+
+
 @app.get("/session/status", response_model=SessionStatusWrapper)
 async def get_session_status(state: AppStateDep) -> SessionStatusWrapper:
     """
@@ -2177,8 +2257,13 @@ async def get_session_status(state: AppStateDep) -> SessionStatusWrapper:
 async def get_session_analysis(
     state: AppStateDep,
     session_id: str | None = None,
+    since: int = 0,
 ) -> SessionAnalysisResponse:
-    """Return the current persisted analysis for the active or requested session."""
+    """Return the current persisted analysis for the active or requested session.
+
+    Pollers pass ``since`` (the item count they already hold) to receive only
+    newer ``analysis_items``; the rolling summary fields are always current.
+    """
     session_manager = state["session_manager"]
     output_writer = state["output_writer"]
 
@@ -2195,7 +2280,9 @@ async def get_session_analysis(
         )
 
     try:
-        analysis = output_writer.load_analysis(resolved_session_id)
+        analysis, total_items = output_writer.load_analysis_since(
+            resolved_session_id, since
+        )
     except Exception as exc:
         logger.error("Failed to load analysis for %s: %s", resolved_session_id, exc)
         raise HTTPException(
@@ -2208,6 +2295,7 @@ async def get_session_analysis(
         message="Analysis loaded" if analysis is not None else "No analysis yet",
         session_id=resolved_session_id,
         analysis=analysis,
+        total_items=total_items,
     )
 
 
@@ -2221,7 +2309,8 @@ async def stream_session_events(
 
     Emits: ``ledger_append`` (MeetingEvent), ``extraction`` (AlfredExtraction),
     ``dossier_upsert`` ({kind, item}), ``tool_call`` (ToolCallRecord),
-    ``session_state`` (summary/topics/muted), ``session_started``,
+    ``session_state`` (summary/topics/muted), ``analysis_item``
+    ({session_id, response_id}, once the item is persisted), ``session_started``,
     ``session_ended``, and periodic ``heartbeat`` comments to defeat proxy
     idle timeouts.
     """